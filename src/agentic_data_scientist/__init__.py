@@ -5,8 +5,29 @@ Agentic Data Scientist provides a clean Python API and CLI for orchestrating com
 using Google's Agent Development Kit (ADK) and Claude Code CLI agents.
 """
 
-from agentic_data_scientist.core.api import DataScientist, Result, SessionConfig
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from agentic_data_scientist.core.api import DataScientist, Result, SessionConfig
 
 
 __version__ = "0.2.3"
 __all__ = ["DataScientist", "Result", "SessionConfig"]
+
+
+def __getattr__(name: str):
+    """
+    Lazily import the public API on first access (PEP 562).
+
+    ``agentic_data_scientist.core.api`` pulls in the full ADK/LiteLLM stack, so it is
+    only imported when one of its symbols is actually used, not when the package
+    (e.g. ``__version__`` or the CLI's ``--help``) is imported.
+    """
+    if name in __all__:
+        from agentic_data_scientist.core import api
+
+        value = getattr(api, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
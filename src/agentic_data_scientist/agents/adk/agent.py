@@ -5,20 +5,19 @@ This module creates the multi-agent system with planning, orchestration,
 implementation, and verification agents.
 """
 
+import asyncio
+import functools
 import logging
 import warnings
 from pathlib import Path
 from typing import AsyncGenerator, List, Optional
 
-from dotenv import load_dotenv
 from google.adk.agents import InvocationContext, LoopAgent, SequentialAgent
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.apps import App
 from google.adk.events import Event
-from google.adk.planners import BuiltInPlanner
 from google.adk.utils.context_utils import Aclosing
-from google.genai import types
 from pydantic import BaseModel, Field
 from typing_extensions import override
 
@@ -28,16 +27,17 @@ from agentic_data_scientist.agents.adk.loop_detection import LoopDetectionAgent
 from agentic_data_scientist.agents.adk.review_confirmation import create_review_confirmation_agent
 from agentic_data_scientist.agents.adk.utils import (
     DEFAULT_MODEL,
+    PLANNING_THINKING_BUDGET,
     REVIEW_MODEL,
+    REVIEW_THINKING_BUDGET,
+    SUMMARY_THINKING_BUDGET,
     get_generate_content_config,
+    get_planner,
     is_network_disabled,
 )
-from agentic_data_scientist.prompts import load_prompt
+from agentic_data_scientist.prompts import load_prompt_parts
 
 
-# Load environment variables
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 # Suppress experimental feature warnings
@@ -139,18 +139,18 @@ def plan_parser_callback(callback_context: CallbackContext):
 
     # Validate structure
     if not isinstance(parsed_output, dict):
-        logger.error(f"[PlanParser] Invalid parsed output type: {type(parsed_output)}")
+        logger.error("[PlanParser] Invalid parsed output type: %s", type(parsed_output))
         return
 
     stages_data = parsed_output.get("stages", [])
     criteria_data = parsed_output.get("success_criteria", [])
 
     if not isinstance(stages_data, list):
-        logger.error(f"[PlanParser] stages is not a list: {type(stages_data)}")
+        logger.error("[PlanParser] stages is not a list: %s", type(stages_data))
         return
 
     if not isinstance(criteria_data, list):
-        logger.error(f"[PlanParser] success_criteria is not a list: {type(criteria_data)}")
+        logger.error("[PlanParser] success_criteria is not a list: %s", type(criteria_data))
         return
 
     logger.info("[PlanParser] Processing parsed plan output")
@@ -160,7 +160,7 @@ def plan_parser_callback(callback_context: CallbackContext):
     for idx, stage in enumerate(stages_data):
         # Validate stage structure
         if not isinstance(stage, dict) or "title" not in stage or "description" not in stage:
-            logger.error(f"[PlanParser] Invalid stage structure at index {idx}: {stage}")
+            logger.error("[PlanParser] Invalid stage structure at index %s: %s", idx, stage)
             continue
 
         stages.append(
@@ -178,7 +178,7 @@ def plan_parser_callback(callback_context: CallbackContext):
     for idx, crit in enumerate(criteria_data):
         # Validate criterion structure
         if not isinstance(crit, dict) or "criteria" not in crit:
-            logger.error(f"[PlanParser] Invalid criterion structure at index {idx}: {crit}")
+            logger.error("[PlanParser] Invalid criterion structure at index %s: %s", idx, crit)
             continue
 
         criteria.append(
@@ -203,7 +203,7 @@ def plan_parser_callback(callback_context: CallbackContext):
     state["high_level_success_criteria"] = criteria
     state["current_stage_index"] = 0
 
-    logger.info(f"[PlanParser] Initialized {len(stages)} stages and {len(criteria)} criteria")
+    logger.info("[PlanParser] Initialized %s stages and %s criteria", len(stages), len(criteria))
 
 
 def criteria_checker_callback(callback_context: CallbackContext):
@@ -235,7 +235,7 @@ def criteria_checker_callback(callback_context: CallbackContext):
 
     updates = criteria_output["criteria_updates"]
     if not isinstance(updates, list):
-        logger.error(f"[CriteriaChecker] criteria_updates is not a list: {type(updates)}")
+        logger.error("[CriteriaChecker] criteria_updates is not a list: %s", type(updates))
         return
 
     logger.info("[CriteriaChecker] Updating criteria status")
@@ -246,12 +246,12 @@ def criteria_checker_callback(callback_context: CallbackContext):
     for update in updates:
         # Validate update structure
         if not isinstance(update, dict):
-            logger.warning(f"[CriteriaChecker] Invalid update structure (not dict): {update}")
+            logger.warning("[CriteriaChecker] Invalid update structure (not dict): %s", update)
             invalid_updates += 1
             continue
 
         if "index" not in update or "met" not in update or "evidence" not in update:
-            logger.warning(f"[CriteriaChecker] Invalid update structure (missing fields): {update}")
+            logger.warning("[CriteriaChecker] Invalid update structure (missing fields): %s", update)
             invalid_updates += 1
             continue
 
@@ -265,11 +265,11 @@ def criteria_checker_callback(callback_context: CallbackContext):
             criteria_text = criteria[idx].get("criteria", "Unknown")
             evidence_text = update["evidence"]
 
-            logger.info(f"[CriteriaChecker] Criterion {idx}: {status}")
-            logger.info(f"[CriteriaChecker]   └─ Criteria: {criteria_text}")
-            logger.info(f"[CriteriaChecker]   └─ Evidence: {evidence_text}")
+            logger.info("[CriteriaChecker] Criterion %s: %s", idx, status)
+            logger.info("[CriteriaChecker]   └─ Criteria: %s", criteria_text)
+            logger.info("[CriteriaChecker]   └─ Evidence: %s", evidence_text)
         else:
-            logger.warning(f"[CriteriaChecker] Invalid criterion index: {idx}")
+            logger.warning("[CriteriaChecker] Invalid criterion index: %s", idx)
             invalid_updates += 1
 
     if valid_updates == 0:
@@ -277,13 +277,14 @@ def criteria_checker_callback(callback_context: CallbackContext):
     elif invalid_updates > len(criteria) // 2:
         # More than half of updates are invalid
         logger.error(
-            f"[CriteriaChecker] Too many invalid updates ({invalid_updates}/{len(updates)}) - "
-            "criteria check may be unreliable"
+            "[CriteriaChecker] Too many invalid updates (%s/%s) - criteria check may be unreliable",
+            invalid_updates,
+            len(updates),
         )
 
     # Log summary of all criteria statuses
     met_count = sum(1 for c in criteria if c.get("met", False))
-    logger.info(f"[CriteriaChecker] Summary: {met_count}/{len(criteria)} criteria met")
+    logger.info("[CriteriaChecker] Summary: %s/%s criteria met", met_count, len(criteria))
 
     state["high_level_success_criteria"] = criteria
 
@@ -312,7 +313,7 @@ def stage_reflector_callback(callback_context: CallbackContext):
         return
 
     if not isinstance(reflector_output, dict):
-        logger.error(f"[StageReflector] Invalid output type: {type(reflector_output)}")
+        logger.error("[StageReflector] Invalid output type: %s", type(reflector_output))
         return
 
     logger.info("[StageReflector] Processing stage reflections")
@@ -320,16 +321,16 @@ def stage_reflector_callback(callback_context: CallbackContext):
     # Apply modifications to existing stages
     modifications = reflector_output.get("stage_modifications", [])
     if not isinstance(modifications, list):
-        logger.error(f"[StageReflector] stage_modifications is not a list: {type(modifications)}")
+        logger.error("[StageReflector] stage_modifications is not a list: %s", type(modifications))
         modifications = []
 
     for mod in modifications:
         if not isinstance(mod, dict):
-            logger.warning(f"[StageReflector] Invalid modification structure: {mod}")
+            logger.warning("[StageReflector] Invalid modification structure: %s", mod)
             continue
 
         if "index" not in mod or "new_description" not in mod:
-            logger.warning(f"[StageReflector] Missing fields in modification: {mod}")
+            logger.warning("[StageReflector] Missing fields in modification: %s", mod)
             continue
 
         idx = mod["index"]
@@ -338,27 +339,27 @@ def stage_reflector_callback(callback_context: CallbackContext):
         if 0 <= idx < len(stages) and new_desc:
             # Check if stage is completed - don't modify completed stages
             if stages[idx].get("completed", False):
-                logger.warning(f"[StageReflector] Cannot modify completed stage {idx} - ignoring")
+                logger.warning("[StageReflector] Cannot modify completed stage %s - ignoring", idx)
                 continue
 
             stages[idx]["description"] = new_desc
-            logger.info(f"[StageReflector] Modified stage {idx} description")
+            logger.info("[StageReflector] Modified stage %s description", idx)
         elif new_desc:
-            logger.warning(f"[StageReflector] Invalid stage index for modification: {idx}")
+            logger.warning("[StageReflector] Invalid stage index for modification: %s", idx)
 
     # Add new stages
     new_stages = reflector_output.get("new_stages", [])
     if not isinstance(new_stages, list):
-        logger.error(f"[StageReflector] new_stages is not a list: {type(new_stages)}")
+        logger.error("[StageReflector] new_stages is not a list: %s", type(new_stages))
         new_stages = []
 
     for new_stage in new_stages:
         if not isinstance(new_stage, dict):
-            logger.warning(f"[StageReflector] Invalid new stage structure: {new_stage}")
+            logger.warning("[StageReflector] Invalid new stage structure: %s", new_stage)
             continue
 
         if "title" not in new_stage or "description" not in new_stage:
-            logger.warning(f"[StageReflector] Missing fields in new stage: {new_stage}")
+            logger.warning("[StageReflector] Missing fields in new stage: %s", new_stage)
             continue
 
         new_idx = len(stages)
@@ -371,7 +372,7 @@ def stage_reflector_callback(callback_context: CallbackContext):
                 "implementation_result": None,
             }
         )
-        logger.info(f"[StageReflector] Added new stage {new_idx}: {new_stage['title']}")
+        logger.info("[StageReflector] Added new stage %s: %s", new_idx, new_stage['title'])
 
     state["high_level_stages"] = stages
 
@@ -381,14 +382,19 @@ class NonEscalatingLoopAgent(LoopAgent):
 
     @override
     async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        # Bind loop invariants once rather than re-reading attributes every pass
+        sub_agents = tuple(self.sub_agents)
+        max_iterations = self.max_iterations
         times_looped = 0
-        while not self.max_iterations or times_looped < self.max_iterations:
-            for sub_agent in self.sub_agents:
+        while not max_iterations or times_looped < max_iterations:
+            for sub_agent in sub_agents:
                 should_exit = False
                 async with Aclosing(sub_agent.run_async(ctx)) as agen:
                     async for event in agen:
-                        if event.actions.escalate:
-                            event.actions.escalate = False
+                        actions = event.actions
+                        if actions.escalate:
+                            # Copy only the escalating event so shared actions are never mutated
+                            event = event.model_copy(update={"actions": actions.model_copy(update={"escalate": False})})
                             should_exit = True
                         yield event
                         if should_exit:
@@ -400,6 +406,31 @@ class NonEscalatingLoopAgent(LoopAgent):
         return
 
 
+def _run_in_thread(func):
+    """
+    Wrap a blocking tool function so ADK awaits it in a worker thread.
+
+    The wrapper keeps the original name, docstring and signature, so the tool
+    declaration exposed to the model is unchanged.
+
+    Parameters
+    ----------
+    func : Callable
+        Synchronous tool function
+
+    Returns
+    -------
+    Callable
+        Async function with the same interface as ``func``
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
 def create_agent(
     working_dir: Optional[str] = None,
     mcp_servers: Optional[List[str]] = None,
@@ -419,16 +450,16 @@ def create_agent(
     LoopDetectionAgent
         The configured root agent
     """
-    # Create working directory if not provided
+    # Create working directory if not provided (mkdtemp already creates it)
     if working_dir is None:
         import tempfile
 
-        working_dir = tempfile.mkdtemp(prefix="agentic_ds_")
+        working_dir = Path(tempfile.mkdtemp(prefix="agentic_ds_"))
+    else:
+        working_dir = Path(working_dir)
+        working_dir.mkdir(parents=True, exist_ok=True)
 
-    working_dir = Path(working_dir)
-    working_dir.mkdir(parents=True, exist_ok=True)
-
-    logger.info(f"[AgenticDS] Creating ADK agent with working_dir={working_dir}")
+    logger.info("[AgenticDS] Creating ADK agent with working_dir=%s", working_dir)
 
     # Create local tools with working_dir bound via wrapper functions
     from agentic_data_scientist.tools import (
@@ -469,7 +500,7 @@ def create_agent(
         """Get detailed metadata about a file."""
         return get_file_info(path, working_dir_str)
 
-    tools = [
+    sync_tools = [
         read_file_bound,
         read_media_file_bound,
         list_directory_bound,
@@ -480,9 +511,14 @@ def create_agent(
 
     # Only add fetch_url if network access is not disabled
     if not is_network_disabled():
-        tools.append(fetch_url)
+        sync_tools.append(fetch_url)
+
+    # The tools do blocking file/network I/O. Runner.run_async calls sync tools
+    # inline on the event loop (RunConfig.tool_thread_pool_config only applies to
+    # live runs), so run each one in a worker thread instead.
+    tools = [_run_in_thread(tool) for tool in sync_tools]
 
-    logger.info(f"[AgenticDS] Configured {len(tools)} local tools")
+    logger.info("[AgenticDS] Configured %s local tools", len(tools))
 
     # ------------------------- Implementation Loop -------------------------
 
@@ -499,31 +535,27 @@ def create_agent(
     # ------------------------- Summary Agent -------------------------
 
     logger.info("[AgenticDS] Loading summary_agent prompt")
-    summary_agent_instructions = load_prompt("summary")
+    summary_agent_static_instructions, summary_agent_instructions = load_prompt_parts("summary")
 
-    logger.info(f"[AgenticDS] Creating summary_agent with model={DEFAULT_MODEL}")
+    logger.info("[AgenticDS] Creating summary_agent with model=%s", DEFAULT_MODEL)
 
     summary_agent = LoopDetectionAgent(
         name="summary_agent",
         model=DEFAULT_MODEL,
         description="Summarizes results into a comprehensive pure text report.",
+        static_instruction=summary_agent_static_instructions,
         instruction=summary_agent_instructions,
         tools=tools,  # Needs tools to read files
-        planner=BuiltInPlanner(
-            thinking_config=types.ThinkingConfig(
-                include_thoughts=True,
-                thinking_budget=-1,
-            ),
-        ),
+        planner=get_planner(SUMMARY_THINKING_BUDGET),
         generate_content_config=get_generate_content_config(temperature=0.3),
     )
 
     # ------------------------- High Level Planning Agents -------------------------
 
     logger.info("[AgenticDS] Loading plan maker agent prompt")
-    plan_maker_instructions = load_prompt("plan_maker")
+    plan_maker_static_instructions, plan_maker_instructions = load_prompt_parts("plan_maker")
 
-    logger.info(f"[AgenticDS] Creating plan maker agent with model={DEFAULT_MODEL}")
+    logger.info("[AgenticDS] Creating plan maker agent with model=%s", DEFAULT_MODEL)
 
     plan_maker_compression = create_compression_callback(event_threshold=40, overlap_size=20)
 
@@ -531,23 +563,19 @@ def create_agent(
         name="plan_maker_agent",
         model=DEFAULT_MODEL,
         description="Plan maker agent - creates high-level plans for complex tasks.",
+        static_instruction=plan_maker_static_instructions,
         instruction=plan_maker_instructions,
         tools=tools,
         output_key="high_level_plan",
-        planner=BuiltInPlanner(
-            thinking_config=types.ThinkingConfig(
-                include_thoughts=True,
-                thinking_budget=-1,
-            ),
-        ),
+        planner=get_planner(PLANNING_THINKING_BUDGET),
         generate_content_config=get_generate_content_config(temperature=0.6),
         after_agent_callback=plan_maker_compression,
     )
 
     logger.info("[AgenticDS] Loading plan reviewer agent prompt")
-    plan_reviewer_instructions = load_prompt("plan_reviewer")
+    plan_reviewer_static_instructions, plan_reviewer_instructions = load_prompt_parts("plan_reviewer")
 
-    logger.info(f"[AgenticDS] Creating plan reviewer agent with model={REVIEW_MODEL}")
+    logger.info("[AgenticDS] Creating plan reviewer agent with model=%s", REVIEW_MODEL)
 
     plan_reviewer_compression = create_compression_callback(event_threshold=40, overlap_size=20)
 
@@ -555,15 +583,11 @@ def create_agent(
         name="plan_reviewer_agent",
         model=REVIEW_MODEL,
         description="Plan reviewer agent - reviews high-level plans for completeness and correctness.",
+        static_instruction=plan_reviewer_static_instructions,
         instruction=plan_reviewer_instructions,
         tools=tools,
         output_key="plan_review_feedback",
-        planner=BuiltInPlanner(
-            thinking_config=types.ThinkingConfig(
-                include_thoughts=True,
-                thinking_budget=-1,
-            ),
-        ),
+        planner=get_planner(REVIEW_THINKING_BUDGET),
         generate_content_config=get_generate_content_config(temperature=0.3),
         after_agent_callback=plan_reviewer_compression,
     )
@@ -582,14 +606,15 @@ def create_agent(
     # ------------------------- High Level Plan Parser -------------------------
 
     logger.info("[AgenticDS] Loading plan parser prompt")
-    plan_parser_instructions = load_prompt("plan_parser")
+    plan_parser_static_instructions, plan_parser_instructions = load_prompt_parts("plan_parser")
 
-    logger.info(f"[AgenticDS] Creating plan parser agent with model={DEFAULT_MODEL}")
+    logger.info("[AgenticDS] Creating plan parser agent with model=%s", DEFAULT_MODEL)
 
     high_level_plan_parser = LoopDetectionAgent(
         name="high_level_plan_parser",
         model=DEFAULT_MODEL,
         description="Parses high-level plan into stages and success criteria.",
+        static_instruction=plan_parser_static_instructions,
         instruction=plan_parser_instructions,
         tools=[],  # NO TOOLS - pure JSON parsing
         output_schema=PLAN_PARSER_OUTPUT_SCHEMA,
@@ -601,9 +626,9 @@ def create_agent(
     # ------------------------- Success Criteria Checker -------------------------
 
     logger.info("[AgenticDS] Loading criteria checker prompt")
-    criteria_checker_instructions = load_prompt("criteria_checker")
+    criteria_checker_static_instructions, criteria_checker_instructions = load_prompt_parts("criteria_checker")
 
-    logger.info(f"[AgenticDS] Creating criteria checker agent with model={REVIEW_MODEL}")
+    logger.info("[AgenticDS] Creating criteria checker agent with model=%s", REVIEW_MODEL)
 
     criteria_checker_compression = create_compression_callback(event_threshold=40, overlap_size=20)
 
@@ -618,6 +643,7 @@ def create_agent(
         name="success_criteria_checker",
         model=REVIEW_MODEL,
         description="Checks which high-level success criteria have been met.",
+        static_instruction=criteria_checker_static_instructions,
         instruction=criteria_checker_instructions,
         tools=tools,  # NEEDS TOOLS to inspect files
         output_schema=CRITERIA_CHECKER_OUTPUT_SCHEMA,
@@ -629,9 +655,9 @@ def create_agent(
     # ------------------------- Stage Reflector -------------------------
 
     logger.info("[AgenticDS] Loading stage reflector prompt")
-    stage_reflector_instructions = load_prompt("stage_reflector")
+    stage_reflector_static_instructions, stage_reflector_instructions = load_prompt_parts("stage_reflector")
 
-    logger.info(f"[AgenticDS] Creating stage reflector agent with model={DEFAULT_MODEL}")
+    logger.info("[AgenticDS] Creating stage reflector agent with model=%s", DEFAULT_MODEL)
 
     stage_reflector_compression = create_compression_callback(event_threshold=40, overlap_size=20)
 
@@ -646,6 +672,7 @@ def create_agent(
         name="stage_reflector",
         model=DEFAULT_MODEL,
         description="Reflects on and adapts remaining implementation stages.",
+        static_instruction=stage_reflector_static_instructions,
         instruction=stage_reflector_instructions,
         tools=tools,  # NEEDS TOOLS for context
         output_schema=STAGE_REFLECTOR_OUTPUT_SCHEMA,
@@ -6,6 +6,7 @@ the event count exceeds a threshold. It uses LLM summarization to create
 concise summaries of event sequences.
 """
 
+import functools
 import logging
 from typing import Optional
 
@@ -45,12 +46,13 @@ def _truncate_large_event_texts(events: list[Event]) -> None:
     for event in events:
         if event.content and event.content.parts:
             for part in event.content.parts:
-                if hasattr(part, 'text') and part.text:
-                    text_len = len(part.text)
+                text = getattr(part, 'text', None)
+                if text:
+                    text_len = len(text)
                     if text_len > LARGE_TEXT_THRESHOLD:
                         # Truncate text to first 1k chars
                         part.text = (
-                            part.text[:LARGE_TEXT_KEEP] + f"\n\n[... truncated {text_len - LARGE_TEXT_KEEP} chars ...]"
+                            text[:LARGE_TEXT_KEEP] + f"\n\n[... truncated {text_len - LARGE_TEXT_KEEP} chars ...]"
                         )
                         truncated_count += 1
 
@@ -58,6 +60,85 @@ def _truncate_large_event_texts(events: list[Event]) -> None:
         logger.info(f"[Compression] Truncated {truncated_count} large text parts (>{LARGE_TEXT_THRESHOLD} chars)")
 
 
+def _count_text_chars(events: list[Event]) -> int:
+    """
+    Count the characters in all text parts of ``events``.
+
+    Parameters
+    ----------
+    events : list[Event]
+        Events to measure
+
+    Returns
+    -------
+    int
+        Total number of text characters
+    """
+    total_chars = 0
+    for event in events:
+        if event.content and event.content.parts:
+            for part in event.content.parts:
+                text = getattr(part, 'text', None)
+                if text:
+                    total_chars += len(text)
+    return total_chars
+
+
+def _find_last_compaction_idx(events: list[Event]) -> int:
+    """
+    Return the index of the most recent compaction event, or -1 if none.
+
+    The scan walks backwards and stops at the first compaction found. Since
+    compression always leaves its summary event just before the uncompressed
+    overlap window, this only touches the events added since the last
+    compaction. An index cached in session state would go stale whenever
+    history trimming or a hard limit rewrites ``session.events``, so the
+    bounded tail scan is used instead.
+
+    Parameters
+    ----------
+    events : list[Event]
+        Session events to scan
+
+    Returns
+    -------
+    int
+        Index of the last compaction event, or -1 if there is none
+    """
+    for i in range(len(events) - 1, -1, -1):
+        actions = events[i].actions
+        if actions and actions.compaction:
+            return i
+    return -1
+
+
+@functools.lru_cache(maxsize=None)
+def _get_summarizer_llm(model_name: str) -> LiteLlm:
+    """
+    Return the shared LiteLlm client used for summarization with ``model_name``.
+
+    The client is built once per model name and reused by every compression
+    call in the process instead of being reconstructed for each summary.
+
+    Parameters
+    ----------
+    model_name : str
+        Model name string (not a model object)
+
+    Returns
+    -------
+    LiteLlm
+        Cached LiteLlm instance
+    """
+    return LiteLlm(
+        model=model_name,
+        num_retries=3,
+        timeout=30,
+        api_base=OPENROUTER_API_BASE if OPENROUTER_API_KEY else None,
+        custom_llm_provider="openrouter" if OPENROUTER_API_KEY else None,
+    )
+
+
 async def _create_event_summary_with_llm(
     events: list[Event],
     model_name: str,
@@ -99,19 +180,22 @@ async def _create_event_summary_with_llm(
 
         if event.content and event.content.parts:
             for part in event.content.parts:
-                if hasattr(part, 'text') and part.text:
+                text = getattr(part, 'text', None)
+                if text:
                     # Keep more text for better summarization (500 chars instead of 200)
-                    text = part.text[:500] if len(part.text) > 500 else part.text
-                    content_texts.append(text)
-                    total_text_chars += len(part.text)
+                    content_texts.append(text[:500])
+                    total_text_chars += len(text)
                     events_with_text += 1
-                if hasattr(part, 'function_call') and part.function_call:
-                    tool_calls.append(part.function_call.name)
+                function_call = getattr(part, 'function_call', None)
+                if function_call:
+                    tool_calls.append(function_call.name)
                     events_with_tools += 1
-                if hasattr(part, 'function_response') and part.function_response:
+                function_response = getattr(part, 'function_response', None)
+                if function_response:
                     # Extract function response name
-                    if hasattr(part.function_response, 'name'):
-                        function_responses.append(part.function_response.name)
+                    name = getattr(function_response, 'name', None)
+                    if name is not None:
+                        function_responses.append(name)
 
         # Format event description - be more detailed
         desc_parts = [f"Event {i} [{author}]"]
@@ -153,14 +237,7 @@ Be detailed and specific - this summary replaces the original events, so preserv
 
     # Call LLM for summarization
     try:
-        # Create LiteLlm instance with the model NAME (string, not object!)
-        llm = LiteLlm(
-            model=model_name,
-            num_retries=3,
-            timeout=30,
-            api_base=OPENROUTER_API_BASE if OPENROUTER_API_KEY else None,
-            custom_llm_provider="openrouter" if OPENROUTER_API_KEY else None,
-        )
+        llm = _get_summarizer_llm(model_name)
 
         # Create LlmRequest with proper structure
         llm_request = LlmRequest(
@@ -223,14 +300,15 @@ async def _compress_session_events(
         Session service for event operations
     """
     events = session.events
+    event_count = len(events)
 
-    if start_idx >= end_idx or end_idx > len(events):
-        logger.warning(f"[Compression] Invalid compression range: {start_idx}:{end_idx} (total {len(events)})")
+    if start_idx >= end_idx or end_idx > event_count:
+        logger.warning(f"[Compression] Invalid compression range: {start_idx}:{end_idx} (total {event_count})")
         return
 
-    # Get timestamp range
-    start_timestamp = events[start_idx].timestamp if start_idx < len(events) else 0.0
-    end_timestamp = events[end_idx - 1].timestamp if end_idx <= len(events) else 0.0
+    # Get timestamp range (both indices are in range after the check above)
+    start_timestamp = events[start_idx].timestamp
+    end_timestamp = events[end_idx - 1].timestamp
 
     # Create compaction event
     compaction = EventCompaction(
@@ -264,17 +342,12 @@ async def _compress_session_events(
     summary_tokens_approx = len(summary_text) // 4  # Rough estimate: 1 token ≈ 4 chars
 
     # Calculate total tokens in remaining events
-    total_chars = 0
-    for evt in session.events:
-        if evt.content and evt.content.parts:
-            for part in evt.content.parts:
-                if hasattr(part, 'text') and part.text:
-                    total_chars += len(part.text)
+    total_chars = _count_text_chars(new_events)
 
     logger.warning(
         f"[Compression] ✓ Compressed {events_removed} events (idx {start_idx}:{end_idx}) "
         f"into 1 summary event (~{summary_tokens_approx} tokens). "
-        f"Total events: {len(session.events)} (was {len(events)}), ~{total_chars // 4} tokens remaining"
+        f"Total events: {len(new_events)} (was {event_count}), ~{total_chars // 4} tokens remaining"
     )
 
 
@@ -335,6 +408,11 @@ def create_compression_callback(
 
         event_count = len(events)
 
+        # Check if compression is needed before paying for the stats scan below
+        if event_count <= event_threshold:
+            logger.debug(f"[Compression] Event count {event_count} below threshold {event_threshold}, skipping")
+            return None
+
         # Calculate approximate token count in events for debugging
         total_chars = 0
         event_sizes = []
@@ -351,13 +429,12 @@ def create_compression_callback(
 
             if event.content and event.content.parts:
                 for part in event.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        event_chars += len(part.text)
+                    text = getattr(part, 'text', None)
+                    if text:
+                        event_chars += len(text)
                         has_content = True
                     # Also check for function calls/responses
-                    if hasattr(part, 'function_call'):
-                        has_content = True
-                    if hasattr(part, 'function_response'):
+                    if getattr(part, 'function_call', None) or getattr(part, 'function_response', None):
                         has_content = True
 
             if has_content:
@@ -385,11 +462,6 @@ def create_compression_callback(
             for size_info in event_sizes[:5]:  # Show first 5 large events
                 logger.warning(f"[Compression]   {size_info}")
 
-        # Check if compression is needed
-        if event_count <= event_threshold:
-            logger.debug(f"[Compression] Event count {event_count} below threshold {event_threshold}, skipping")
-            return None
-
         logger.warning(f"[Compression] ⚠️ Event count {event_count} exceeds threshold {event_threshold}, compressing...")
 
         # Determine compression range
@@ -401,11 +473,7 @@ def create_compression_callback(
             return None
 
         # Find last compaction to avoid re-compressing
-        last_compaction_idx = -1
-        for i in range(len(events) - 1, -1, -1):
-            if events[i].actions and events[i].actions.compaction:
-                last_compaction_idx = i
-                break
+        last_compaction_idx = _find_last_compaction_idx(events)
 
         # Start compression from after last compaction
         start_idx = max(0, last_compaction_idx + 1)
@@ -418,12 +486,7 @@ def create_compression_callback(
         events_to_compress = events[start_idx:end_idx]
 
         # Calculate size BEFORE truncation
-        compress_chars_before = 0
-        for event in events_to_compress:
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        compress_chars_before += len(part.text)
+        compress_chars_before = _count_text_chars(events_to_compress)
 
         logger.warning(
             f"[Compression] Will compress events {start_idx}:{end_idx} "
@@ -434,12 +497,7 @@ def create_compression_callback(
         _truncate_large_event_texts(events_to_compress)
 
         # Calculate size AFTER truncation
-        compress_chars_after = 0
-        for event in events_to_compress:
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        compress_chars_after += len(part.text)
+        compress_chars_after = _count_text_chars(events_to_compress)
 
         logger.info(
             f"[Compression] After truncation: ~{compress_chars_after // 4} tokens "
@@ -518,11 +576,7 @@ async def compress_events_manually(
         return
 
     # Find last compaction
-    last_compaction_idx = -1
-    for i in range(len(events) - 1, -1, -1):
-        if events[i].actions and events[i].actions.compaction:
-            last_compaction_idx = i
-            break
+    last_compaction_idx = _find_last_compaction_idx(events)
 
     start_idx = max(0, last_compaction_idx + 1)
 
@@ -599,16 +653,15 @@ def create_hard_limit_callback(max_events: int = 50):
         """
         session = callback_context._invocation_context.session
         events = session.events
+        original_count = len(events)
 
-        logger.info(f"[HardLimit] Checking event count: {len(events)} events, max={max_events}")
+        logger.info(f"[HardLimit] Checking event count: {original_count} events, max={max_events}")
 
-        if len(events) > max_events:
-            original_count = len(events)
+        if original_count > max_events:
             discarded_count = original_count - max_events
 
             # Get event authors for logging
-            discarded_events = events[:discarded_count]
-            discarded_authors = [getattr(e, 'author', 'unknown') for e in discarded_events[:5]]
+            discarded_authors = [getattr(e, 'author', 'unknown') for e in events[: min(5, discarded_count)]]
 
             # CRITICAL: Direct assignment like working example
             session.events = events[-max_events:]
@@ -618,7 +671,7 @@ def create_hard_limit_callback(max_events: int = 50):
                 f"Discarded {discarded_count} events, first 5 authors: {discarded_authors}"
             )
         else:
-            logger.debug(f"[HardLimit] No trimming needed: {len(events)} <= {max_events}")
+            logger.debug(f"[HardLimit] No trimming needed: {original_count} <= {max_events}")
 
         return None
 
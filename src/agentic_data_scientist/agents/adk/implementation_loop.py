@@ -7,15 +7,18 @@ iterative loop to implement and verify solutions.
 
 import logging
 
-from google.adk.planners import BuiltInPlanner
 from google.adk.tools.tool_context import CallbackContext
-from google.genai import types
 
 from agentic_data_scientist.agents.adk.event_compression import create_compression_callback
 from agentic_data_scientist.agents.adk.loop_detection import LoopDetectionAgent
 from agentic_data_scientist.agents.adk.review_confirmation import create_review_confirmation_agent
-from agentic_data_scientist.agents.adk.utils import REVIEW_MODEL, get_generate_content_config
-from agentic_data_scientist.prompts import load_prompt
+from agentic_data_scientist.agents.adk.utils import (
+    REVIEW_MODEL,
+    REVIEW_THINKING_BUDGET,
+    get_generate_content_config,
+    get_planner,
+)
+from agentic_data_scientist.prompts import load_prompt_parts
 
 
 logger = logging.getLogger(__name__)
@@ -42,18 +45,17 @@ def trim_history_to_recent_events(callback_context: CallbackContext, max_events:
     session = callback_context._invocation_context.session
     events = session.events
 
-    logger.info(f"[DEBUG] trim_history_to_recent_events called: {len(events)} events, max={max_events}")
+    logger.debug("[AgenticDS] trim_history_to_recent_events called: %s events, max=%s", len(events), max_events)
 
     if len(events) > max_events:
         # Keep only the most recent events
         events_to_remove = len(events) - max_events
-        logger.info(f"[DEBUG] Trimming {events_to_remove} old events, keeping {max_events} most recent")
+        logger.debug("[AgenticDS] Trimming %s old events, keeping %s most recent", events_to_remove, max_events)
 
-        # Remove oldest events
-        for _ in range(events_to_remove):
-            events.pop(0)
+        # Remove oldest events in place with a single slice deletion
+        del events[:events_to_remove]
 
-        logger.info(f"[DEBUG] After trimming: {len(events)} events remain")
+        logger.debug("[AgenticDS] After trimming: %s events remain", len(events))
 
 
 def make_implementation_agents(working_dir: str, tools: list):
@@ -72,7 +74,7 @@ def make_implementation_agents(working_dir: str, tools: list):
     tuple
         (coding_agent, review_agent, review_confirmation_agent)
     """
-    logger.info(f"[AgenticDS] Initializing implementation agents with {len(tools)} tools")
+    logger.info("[AgenticDS] Initializing implementation agents with %s tools", len(tools))
 
     # Always use ClaudeCodeAgent for coding
     from agentic_data_scientist.agents.claude_code import ClaudeCodeAgent
@@ -95,7 +97,7 @@ def make_implementation_agents(working_dir: str, tools: list):
     logger.info("[AgenticDS] Creating review agent")
 
     # Load review prompt
-    review_prompt = load_prompt("coding_review")
+    review_static_prompt, review_prompt = load_prompt_parts("coding_review")
 
     # Create compression callback for review agent
     review_compression_callback = create_compression_callback(
@@ -106,15 +108,11 @@ def make_implementation_agents(working_dir: str, tools: list):
     review_agent = LoopDetectionAgent(
         name="review_agent",
         description="Reviews implementation and provides feedback or approval.",
+        static_instruction=review_static_prompt,
         instruction=review_prompt,
         model=REVIEW_MODEL,
         tools=tools,
-        planner=BuiltInPlanner(
-            thinking_config=types.ThinkingConfig(
-                include_thoughts=True,
-                thinking_budget=-1,
-            ),
-        ),
+        planner=get_planner(REVIEW_THINKING_BUDGET),
         generate_content_config=get_generate_content_config(temperature=0.0),
         output_key="review_feedback",
         include_contents="none",
@@ -18,6 +18,8 @@ from typing_extensions import override
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class LoopDetectionAgent(LlmAgent):
     """
@@ -118,52 +120,101 @@ class LoopDetectionAgent(LlmAgent):
 
         return "".join(text_parts)
 
+    @staticmethod
+    def _find_periodic_run(text: str, period: int, repetitions: int) -> Optional[int]:
+        """
+        Find ``repetitions`` consecutive copies of some ``period``-length pattern.
+
+        Consecutive copies are equivalent to a span of ``(repetitions - 1) * period``
+        positions where ``text[i] == text[i + period]``. Rather than testing every
+        start offset, the text is compared against itself shifted by ``period`` in
+        aligned chunks of ``period // 2`` characters (C-level slice comparisons). Any
+        qualifying span must fully contain a minimum number of consecutive matching
+        chunks, so only those runs are extended character by character (at most one
+        chunk in each direction) to measure the span exactly.
+
+        Time complexity: O(N) character comparisons per period.
+
+        Parameters
+        ----------
+        text : str
+            Text to scan
+        period : int
+            Length of the candidate repeated pattern
+        repetitions : int
+            Number of consecutive copies required
+
+        Returns
+        -------
+        Optional[int]
+            Start index of the first qualifying repetition, or None
+        """
+        text_len = len(text)
+        needed = (repetitions - 1) * period
+        last = text_len - period
+        if needed > last:
+            return None
+
+        chunk = max(1, period // 2)
+        min_chunks = max(1, (needed - chunk + 1) // chunk)
+
+        def _measure(lo: int, hi: int) -> Optional[int]:
+            # [lo, hi) is known to be periodic; extend it exactly in both directions
+            while lo > 0 and text[lo - 1] == text[lo - 1 + period]:
+                lo -= 1
+            while hi < last and text[hi] == text[hi + period]:
+                hi += 1
+            return lo if hi - lo >= needed else None
+
+        run_start = 0
+        matched = 0
+        for start in range(0, last, chunk):
+            end = min(start + chunk, last)
+            if text[start:end] == text[start + period : end + period]:
+                if matched == 0:
+                    run_start = start
+                matched += 1
+                continue
+            if matched >= min_chunks:
+                found = _measure(run_start, start)
+                if found is not None:
+                    return found
+            matched = 0
+
+        if matched >= min_chunks:
+            return _measure(run_start, last)
+        return None
+
     def _detect_pattern_repetition(self, text: str) -> Tuple[bool, Optional[str]]:
         """
-        Optimized pattern detection - check smallest patterns first.
+        Detect a pattern repeated ``repetition_threshold`` times in a row.
 
-        Key insight: If a long pattern repeats N times, shorter patterns
-        repeat more times. So we check from smallest to largest and exit
-        as soon as we find ANY valid repetition.
+        Pattern lengths are checked from smallest to largest and the scan exits
+        on the first repetition found: if a long pattern repeats N times, shorter
+        periods of it are found first, so there is no need to find the "best"
+        pattern. Each length is checked exactly in linear time by
+        ``_find_periodic_run``.
 
-        Time complexity: O(N²) worst case, but O(N) best case when loops exist
+        Time complexity: O(N × (max_pattern_length - min_pattern_length))
 
         Returns:
             Tuple of (loop_detected, repeated_pattern)
         """
-        if len(text) < self.min_pattern_length * self.repetition_threshold:
+        threshold = self.repetition_threshold
+        if len(text) < self.min_pattern_length * threshold:
             return False, None
 
         # Clean text for pattern detection (remove extra whitespace)
-        clean_text = re.sub(r'\s+', ' ', text).strip()
-        text_len = len(clean_text)
+        clean_text = _WHITESPACE_RE.sub(' ', text).strip()
 
         # Maximum feasible pattern length
-        max_pattern = min(text_len // self.repetition_threshold, self.max_pattern_length)
+        max_pattern = min(len(clean_text) // threshold, self.max_pattern_length)
 
-        # CHECK FROM SMALLEST TO LARGEST - exit on first match!
-        # This is key: we don't need to find the "best" pattern, just ANY pattern
         for pattern_len in range(self.min_pattern_length, max_pattern + 1):
-            # For each length, scan through the text
-            # Use sliding window with optimization for large texts
-            step = 1 if text_len < 2000 else pattern_len // 4
-            step = max(1, step)
-
-            for start in range(0, text_len - pattern_len * self.repetition_threshold + 1, step):
-                pattern = clean_text[start : start + pattern_len]
-
-                # Count consecutive repetitions from this position
-                count = 0
-                pos = start
-
-                while pos + pattern_len <= text_len and clean_text[pos : pos + pattern_len] == pattern:
-                    count += 1
-                    pos += pattern_len
-
-                # Early exit on first valid pattern found!
-                if count >= self.repetition_threshold:
-                    logger.warning(f"Loop detected: Pattern of length {pattern_len} repeated {count} times")
-                    return True, pattern[:100]
+            start = self._find_periodic_run(clean_text, pattern_len, threshold)
+            if start is not None:
+                logger.warning(f"Loop detected: Pattern of length {pattern_len} repeated {threshold}+ times")
+                return True, clean_text[start : start + min(pattern_len, 100)]
 
         return False, None
 
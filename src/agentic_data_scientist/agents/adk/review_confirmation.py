@@ -9,13 +9,17 @@ of normal text output and does not have access to any tools.
 import logging
 
 from google.adk.agents.callback_context import CallbackContext
-from google.adk.planners import BuiltInPlanner
 from google.genai import types
 from pydantic import BaseModel, Field
 
 from agentic_data_scientist.agents.adk.loop_detection import LoopDetectionAgent
-from agentic_data_scientist.agents.adk.utils import REVIEW_MODEL, get_generate_content_config
-from agentic_data_scientist.prompts import load_prompt
+from agentic_data_scientist.agents.adk.utils import (
+    CONFIRMATION_THINKING_BUDGET,
+    REVIEW_MODEL,
+    get_generate_content_config,
+    get_planner,
+)
+from agentic_data_scientist.prompts import load_prompt_parts
 
 
 logger = logging.getLogger(__name__)
@@ -47,9 +51,9 @@ def _create_clear_decision_callback(state_key: str):
         if state_key in state:
             old_value = state[state_key]
             del state[state_key]
-            logger.debug(f"[ReviewConfirmation] Cleared stale decision from state key '{state_key}': {old_value}")
+            logger.debug("[ReviewConfirmation] Cleared stale decision from state key '%s': %s", state_key, old_value)
         else:
-            logger.debug(f"[ReviewConfirmation] No stale decision to clear for key '{state_key}'")
+            logger.debug("[ReviewConfirmation] No stale decision to clear for key '%s'", state_key)
 
     return clear_decision_callback
 
@@ -98,36 +102,37 @@ def _create_exit_loop_callback(state_key: str):
         decision = state.get(state_key)
 
         if not decision:
-            logger.warning(f"[ReviewConfirmation] No decision found in state key '{state_key}' - not exiting loop")
+            logger.warning("[ReviewConfirmation] No decision found in state key '%s' - not exiting loop", state_key)
             return None
 
-        # Validate that decision is a dictionary before calling .get()
-        if not isinstance(decision, dict):
+        # Only a dict-shaped decision carries an exit flag
+        try:
+            should_exit = decision.get("exit", False)
+        except AttributeError:
             logger.error(
-                f"[ReviewConfirmation] Invalid decision type in key '{state_key}': {type(decision)} - not exiting loop"
+                "[ReviewConfirmation] Invalid decision type in key '%s': %s - not exiting loop",
+                state_key,
+                type(decision),
             )
             return None
-
-        # Check if the agent decided to exit
-        should_exit = decision.get("exit", False)
         reason = decision.get("reason", "No reason provided")
 
-        if should_exit:
-            logger.info(f"[ReviewConfirmation] Exiting loop (key='{state_key}') - Reason: {reason}")
-            # Set escalate flag on the event_actions
-            if hasattr(callback_context, '_event_actions') and callback_context._event_actions:
-                callback_context._event_actions.escalate = True
-            else:
-                logger.warning("[ReviewConfirmation] No event_actions available - cannot escalate")
-                return None
-
-            # Return empty content to trigger event creation with the escalate flag
-            # This ensures NonEscalatingLoopAgent receives the escalate signal
-            return types.Content(role="model", parts=[])
-        else:
-            logger.info(f"[ReviewConfirmation] Continuing loop (key='{state_key}') - Reason: {reason}")
+        if not should_exit:
+            logger.info("[ReviewConfirmation] Continuing loop (key='%s') - Reason: %s", state_key, reason)
             return None
 
+        logger.info("[ReviewConfirmation] Exiting loop (key='%s') - Reason: %s", state_key, reason)
+        # Set escalate flag on the event_actions
+        event_actions = getattr(callback_context, '_event_actions', None)
+        if not event_actions:
+            logger.warning("[ReviewConfirmation] No event_actions available - cannot escalate")
+            return None
+        event_actions.escalate = True
+
+        # Return empty content to trigger event creation with the escalate flag
+        # This ensures NonEscalatingLoopAgent receives the escalate signal
+        return types.Content(role="model", parts=[])
+
     return exit_loop_callback
 
 
@@ -196,13 +201,13 @@ def create_review_confirmation_agent(
     A before_agent_callback is used to clear any stale decisions before the agent runs,
     providing defense-in-depth against state pollution.
     """
-    logger.info(f"[AgenticDS] Creating review confirmation agent (prompt={prompt_name})")
+    logger.info("[AgenticDS] Creating review confirmation agent (prompt=%s)", prompt_name)
 
-    instruction = load_prompt(prompt_name)
+    static_instruction, instruction = load_prompt_parts(prompt_name)
 
     # Create unique state key per agent instance to prevent cross-contamination
     state_key = f"{prompt_name}_decision"
-    logger.debug(f"[AgenticDS] Using state key: {state_key}")
+    logger.debug("[AgenticDS] Using state key: %s", state_key)
 
     # Create agent-specific callbacks using factory functions
     # These closures capture the state_key for this specific agent instance
@@ -213,14 +218,10 @@ def create_review_confirmation_agent(
         name=f"{prompt_name}_agent",
         model=REVIEW_MODEL,
         description="Determines whether to exit the review loop based on implementation status.",
+        static_instruction=static_instruction,
         instruction=instruction,
         tools=[],  # No tools - structured output only
-        planner=BuiltInPlanner(
-            thinking_config=types.ThinkingConfig(
-                include_thoughts=True,
-                thinking_budget=-1,
-            ),
-        ),
+        planner=get_planner(CONFIRMATION_THINKING_BUDGET),
         generate_content_config=get_generate_content_config(temperature=0.0),
         output_schema=REVIEW_CONFIRMATION_OUTPUT_SCHEMA,  # Use output_schema for structured JSON
         output_key=state_key,  # Use unique state key per agent instance
@@ -229,8 +230,11 @@ def create_review_confirmation_agent(
     )
 
     logger.info(
-        f"[AgenticDS] Review confirmation agent created successfully "
-        f"(prompt={prompt_name}, state_key={state_key}, auto_exit_on_completion={auto_exit_on_completion})"
+        "[AgenticDS] Review confirmation agent created successfully "
+        "(prompt=%s, state_key=%s, auto_exit_on_completion=%s)",
+        prompt_name,
+        state_key,
+        auto_exit_on_completion,
     )
 
     return agent
@@ -7,7 +7,7 @@ remaining stages through reflection.
 """
 
 import logging
-from typing import Any, AsyncGenerator, Dict, List
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from google.adk.agents import BaseAgent, InvocationContext
 from google.adk.events import Event, EventActions
@@ -19,6 +19,17 @@ from agentic_data_scientist.agents.adk.event_compression import compress_events_
 
 logger = logging.getLogger(__name__)
 
+# Keys every stage / success criterion must carry for orchestration to proceed
+_REQUIRED_STAGE_KEYS = frozenset({"index", "title"})
+_REQUIRED_CRITERION_KEYS = frozenset({"index", "criteria"})
+
+# Once the reflector has had to extend an exhausted plan, stop after this many
+# further stages in a row that leave the met-criteria count unchanged
+MAX_STALLED_ITERATIONS = 3
+# Stop instead of asking the reflector to extend the plan again after this many
+# consecutive extensions that were followed by no criteria progress
+MAX_UNPRODUCTIVE_EXTENSIONS = 2
+
 
 def format_criteria_status(criteria: List[Dict], max_length: int = 80) -> str:
     """
@@ -164,8 +175,10 @@ class StageOrchestratorAgent(BaseAgent):
         )
 
         logger.info(
-            f"[StageOrchestrator] Terminal run status: {run_status} "
-            f"({len(unmet)} unmet criteria, {len(unapproved)} unapproved stages)"
+            "[StageOrchestrator] Terminal run status: %s (%s unmet criteria, %s unapproved stages)",
+            run_status,
+            len(unmet),
+            len(unapproved),
         )
         return {"run_status": run_status, "unmet": unmet, "unapproved": unapproved}
 
@@ -202,6 +215,44 @@ class StageOrchestratorAgent(BaseAgent):
                 delta[key] = state[key]
         return delta
 
+    def _text_event(self, text: str, state_delta: Optional[Dict[str, Any]] = None, **event_kwargs: Any) -> Event:
+        """
+        Build a model-authored text event from this orchestrator.
+
+        Parameters
+        ----------
+        text : str
+            Event text
+        state_delta : Dict[str, Any], optional
+            State delta to attach via ``EventActions``
+        **event_kwargs
+            Extra ``Event`` fields such as ``turn_complete`` or ``partial``
+
+        Returns
+        -------
+        Event
+            The constructed event
+        """
+        if state_delta is not None:
+            event_kwargs["actions"] = EventActions(state_delta=state_delta)
+        return Event(
+            author=self.name,
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            **event_kwargs,
+        )
+
+    @staticmethod
+    def _advance_stage_cursor(stages: List[Dict[str, Any]], cursor: int) -> int:
+        """
+        Move ``cursor`` forward past completed stages.
+
+        Returns the index of the first uncompleted stage at or after ``cursor``,
+        or ``len(stages)`` when every stage is completed.
+        """
+        while cursor < len(stages) and stages[cursor].get("completed", False):
+            cursor += 1
+        return cursor
+
     async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
         """
         Main orchestration logic.
@@ -242,18 +293,9 @@ class StageOrchestratorAgent(BaseAgent):
         if not stages or len(stages) == 0:
             logger.error("[StageOrchestrator] No stages found in state!")
             state["run_status"] = "incomplete"
-            error_event = Event(
-                author=self.name,
-                content=types.Content(
-                    role="model",
-                    parts=[
-                        types.Part(
-                            text="\n\n[ERROR] No high-level stages found in state. "
-                            "Cannot proceed with orchestration.\n\n"
-                        )
-                    ],
-                ),
-                actions=EventActions(state_delta=self._status_state_delta(state)),
+            error_event = self._text_event(
+                "\n\n[ERROR] No high-level stages found in state. Cannot proceed with orchestration.\n\n",
+                state_delta=self._status_state_delta(state),
                 turn_complete=True,
             )
             yield error_event
@@ -263,21 +305,13 @@ class StageOrchestratorAgent(BaseAgent):
         stages_to_check = min(3, len(stages))
         for i in range(stages_to_check):
             stage = stages[i]
-            if not isinstance(stage, dict) or "index" not in stage or "title" not in stage:
-                logger.error(f"[StageOrchestrator] Stages have invalid structure at index {i}!")
+            if not (isinstance(stage, dict) and stage.keys() >= _REQUIRED_STAGE_KEYS):
+                logger.error("[StageOrchestrator] Stages have invalid structure at index %s!", i)
                 state["run_status"] = "incomplete"
-                error_event = Event(
-                    author=self.name,
-                    content=types.Content(
-                        role="model",
-                        parts=[
-                            types.Part(
-                                text=f"\n\n[ERROR] High-level stages have invalid structure. "
-                                f"Stage at index {i} is missing required fields.\n\n"
-                            )
-                        ],
-                    ),
-                    actions=EventActions(state_delta=self._status_state_delta(state)),
+                error_event = self._text_event(
+                    f"\n\n[ERROR] High-level stages have invalid structure. "
+                    f"Stage at index {i} is missing required fields.\n\n",
+                    state_delta=self._status_state_delta(state),
                     turn_complete=True,
                 )
                 yield error_event
@@ -287,18 +321,9 @@ class StageOrchestratorAgent(BaseAgent):
         if not criteria or len(criteria) == 0:
             logger.error("[StageOrchestrator] No success criteria found in state!")
             state["run_status"] = "incomplete"
-            error_event = Event(
-                author=self.name,
-                content=types.Content(
-                    role="model",
-                    parts=[
-                        types.Part(
-                            text="\n\n[ERROR] No success criteria found in state. "
-                            "Cannot proceed with orchestration.\n\n"
-                        )
-                    ],
-                ),
-                actions=EventActions(state_delta=self._status_state_delta(state)),
+            error_event = self._text_event(
+                "\n\n[ERROR] No success criteria found in state. Cannot proceed with orchestration.\n\n",
+                state_delta=self._status_state_delta(state),
                 turn_complete=True,
             )
             yield error_event
@@ -308,62 +333,62 @@ class StageOrchestratorAgent(BaseAgent):
         criteria_to_check = min(3, len(criteria))
         for i in range(criteria_to_check):
             criterion = criteria[i]
-            if not isinstance(criterion, dict) or "index" not in criterion or "criteria" not in criterion:
-                logger.error(f"[StageOrchestrator] Criteria have invalid structure at index {i}!")
+            if not (isinstance(criterion, dict) and criterion.keys() >= _REQUIRED_CRITERION_KEYS):
+                logger.error("[StageOrchestrator] Criteria have invalid structure at index %s!", i)
                 state["run_status"] = "incomplete"
-                error_event = Event(
-                    author=self.name,
-                    content=types.Content(
-                        role="model",
-                        parts=[
-                            types.Part(
-                                text=f"\n\n[ERROR] Success criteria have invalid structure. "
-                                f"Criterion at index {i} is missing required fields.\n\n"
-                            )
-                        ],
-                    ),
-                    actions=EventActions(state_delta=self._status_state_delta(state)),
+                error_event = self._text_event(
+                    f"\n\n[ERROR] Success criteria have invalid structure. "
+                    f"Criterion at index {i} is missing required fields.\n\n",
+                    state_delta=self._status_state_delta(state),
                     turn_complete=True,
                 )
                 yield error_event
                 return
 
-        logger.info(f"[StageOrchestrator] Starting orchestration with {len(stages)} stages")
-        logger.info(f"[StageOrchestrator] Success criteria count: {len(criteria)}")
+        logger.info("[StageOrchestrator] Starting orchestration with %s stages", len(stages))
+        logger.info("[StageOrchestrator] Success criteria count: %s", len(criteria))
 
         # Log all success criteria at the start for visibility
         logger.info("[StageOrchestrator] Success Criteria (End-State Goals):")
-        logger.info(format_criteria_status(criteria))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(format_criteria_status(criteria))
         logger.info(
             "[StageOrchestrator] Note: These are end-state goals that will be progressively "
             "met as stages complete. Early 'NOT MET' status is expected and normal."
         )
 
-        # Initialize stage_implementations if not exists
-        if "stage_implementations" not in state:
-            state["stage_implementations"] = []
-
         # Main orchestration loop
         iteration = 0
         max_iterations = 50  # Safety limit to prevent infinite loops
+        # Stages complete strictly in order and the reflector only edits or appends
+        # uncompleted ones, so the next stage can be found with a forward-only cursor
+        stage_cursor = 0
+        # Stall detection: only armed after the reflector extends an exhausted plan, since
+        # early stages routinely finish without meeting any criterion yet
+        plan_extended = False
+        last_met_count = -1
+        stalled_iterations = 0
+        met_count_at_extension = -1
+        unproductive_extensions = 0
 
         while iteration < max_iterations:
             iteration += 1
-            logger.info(f"[StageOrchestrator] === Orchestration iteration {iteration} ===")
+            logger.info("[StageOrchestrator] === Orchestration iteration %s ===", iteration)
 
             # Refresh state objects (they may have been modified by callbacks)
             stages = state.get("high_level_stages", [])
             criteria = state.get("high_level_success_criteria", [])
 
-            # Check exit condition: all criteria met?
+            # Check exit condition: all criteria met? (one pass gives both the count and the verdict)
             criteria_met_count = sum(1 for c in criteria if c.get("met", False))
-            logger.info(f"[StageOrchestrator] Criteria status: {criteria_met_count}/{len(criteria)} met")
+            logger.info("[StageOrchestrator] Criteria status: %s/%s met", criteria_met_count, len(criteria))
 
-            if all(c.get("met", False) for c in criteria):
+            if criteria_met_count == len(criteria):
                 info = self._apply_terminal_status(state)
                 run_status = info["run_status"]
                 logger.info(
-                    f"[StageOrchestrator] 🎉 All success criteria met! Exiting to summary (status={run_status})."
+                    "[StageOrchestrator] 🎉 All success criteria met! Exiting to summary (status=%s).",
+                    run_status,
                 )
 
                 status_block = self._format_status_block(info)
@@ -380,26 +405,76 @@ class StageOrchestratorAgent(BaseAgent):
                     )
 
                 # Create completion event
-                completion_event = Event(
-                    author=self.name,
-                    content=types.Content(
-                        role="model",
-                        parts=[types.Part(text=header + (status_block + "\n\n" if status_block else ""))],
-                    ),
-                    actions=EventActions(state_delta=self._status_state_delta(state)),
+                completion_event = self._text_event(
+                    header + (status_block + "\n\n" if status_block else ""),
+                    state_delta=self._status_state_delta(state),
                     turn_complete=True,
                 )
                 yield completion_event
                 return
 
+            if criteria_met_count != last_met_count:
+                last_met_count = criteria_met_count
+                stalled_iterations = 0
+            elif plan_extended:
+                stalled_iterations += 1
+
+            if stalled_iterations >= MAX_STALLED_ITERATIONS:
+                info = self._apply_terminal_status(state)
+                logger.error(
+                    "[StageOrchestrator] Criteria progress stalled at %s/%s "
+                    "for %s stages after extending the plan. "
+                    "Exiting orchestration (status=%s).",
+                    criteria_met_count,
+                    len(criteria),
+                    stalled_iterations,
+                    info['run_status'],
+                )
+                status_block = self._format_status_block(info)
+                stalled_event = self._text_event(
+                    f"\n\n⚠️ No success criteria progress in the last {stalled_iterations} stages "
+                    f"(status: {info['run_status']}). Proceeding to summary with current progress.\n\n"
+                    + (status_block + "\n\n" if status_block else ""),
+                    state_delta=self._status_state_delta(state),
+                    turn_complete=True,
+                )
+                yield stalled_event
+                return
+
             # Get next uncompleted stage
-            remaining_stages = [s for s in stages if not s.get("completed", False)]
+            stage_cursor = self._advance_stage_cursor(stages, stage_cursor)
 
-            if not remaining_stages:
+            if stage_cursor >= len(stages):
                 logger.warning(
                     "[StageOrchestrator] No remaining stages but criteria not met. Asking reflector to extend stages."
                 )
 
+                # Count extensions whose added stages met no further criteria before asking again
+                if plan_extended and criteria_met_count == met_count_at_extension:
+                    unproductive_extensions += 1
+                else:
+                    unproductive_extensions = 0
+                met_count_at_extension = criteria_met_count
+
+                if unproductive_extensions >= MAX_UNPRODUCTIVE_EXTENSIONS:
+                    info = self._apply_terminal_status(state)
+                    logger.error(
+                        "[StageOrchestrator] %s plan extensions in a row made no criteria progress. "
+                        "Exiting orchestration (status=%s).",
+                        unproductive_extensions,
+                        info['run_status'],
+                    )
+                    status_block = self._format_status_block(info)
+                    unproductive_event = self._text_event(
+                        f"\n\n⚠️ The last {unproductive_extensions} plan extensions did not advance any "
+                        f"success criteria (status: {info['run_status']}). Proceeding to summary.\n\n"
+                        + (status_block + "\n\n" if status_block else ""),
+                        state_delta=self._status_state_delta(state),
+                        turn_complete=True,
+                    )
+                    yield unproductive_event
+                    return
+
                 # Run reflector to extend stages if needed
                 logger.info("[StageOrchestrator] Running stage_reflector to extend plan...")
                 async for event in self.stage_reflector.run_async(ctx):
@@ -407,52 +482,39 @@ class StageOrchestratorAgent(BaseAgent):
 
                 # Refresh stages from state (reflector may have modified them)
                 stages = state.get("high_level_stages", [])
-                remaining_stages = [s for s in stages if not s.get("completed", False)]
+                stage_cursor = self._advance_stage_cursor(stages, stage_cursor)
 
-                if not remaining_stages:
+                if stage_cursor >= len(stages):
                     info = self._apply_terminal_status(state)
                     logger.error(
                         "[StageOrchestrator] Still no stages after reflection. "
-                        f"Exiting despite incomplete criteria (status={info['run_status']})."
+                        "Exiting despite incomplete criteria (status=%s).",
+                        info['run_status'],
                     )
                     status_block = self._format_status_block(info)
-                    warning_event = Event(
-                        author=self.name,
-                        content=types.Content(
-                            role="model",
-                            parts=[
-                                types.Part(
-                                    text="\n\n⚠️ No remaining stages to implement, but not all "
-                                    f"success criteria are met (status: {info['run_status']}). "
-                                    "Proceeding to summary.\n\n" + (status_block + "\n\n" if status_block else "")
-                                )
-                            ],
-                        ),
-                        actions=EventActions(state_delta=self._status_state_delta(state)),
+                    warning_event = self._text_event(
+                        "\n\n⚠️ No remaining stages to implement, but not all "
+                        f"success criteria are met (status: {info['run_status']}). "
+                        "Proceeding to summary.\n\n" + (status_block + "\n\n" if status_block else ""),
+                        state_delta=self._status_state_delta(state),
                         turn_complete=True,
                     )
                     yield warning_event
                     return
 
+                plan_extended = True
+
             # Get next stage to implement
-            next_stage = remaining_stages[0]
+            next_stage = stages[stage_cursor]
             stage_idx = next_stage["index"]
 
-            logger.info(f"[StageOrchestrator] 📍 Starting stage {stage_idx}: {next_stage['title']}")
+            logger.info("[StageOrchestrator] 📍 Starting stage %s: %s", stage_idx, next_stage['title'])
 
             # Create stage start event
-            stage_start_event = Event(
-                author=self.name,
-                content=types.Content(
-                    role="model",
-                    parts=[
-                        types.Part(
-                            text=f"\n\n### Stage {stage_idx + 1}: {next_stage['title']}\n\n"
-                            f"{next_stage['description']}\n\n"
-                            "Beginning implementation...\n\n"
-                        )
-                    ],
-                ),
+            stage_start_event = self._text_event(
+                f"\n\n### Stage {stage_idx + 1}: {next_stage['title']}\n\n"
+                f"{next_stage['description']}\n\n"
+                "Beginning implementation...\n\n",
                 partial=False,
             )
             yield stage_start_event
@@ -474,13 +536,13 @@ class StageOrchestratorAgent(BaseAgent):
             logger.info("")
             logger.info("")
             logger.info("")
-            logger.info(f"[StageOrchestrator] Running implementation_loop for stage {stage_idx}")
+            logger.info("[StageOrchestrator] Running implementation_loop for stage %s", stage_idx)
 
             try:
                 async for event in self.implementation_loop.run_async(ctx):
                     yield event
 
-                logger.info(f"[StageOrchestrator] Completed implementation_loop for stage {stage_idx}")
+                logger.info("[StageOrchestrator] Completed implementation_loop for stage %s", stage_idx)
 
                 # === Manual Event Compression After Implementation Loop ===
                 logger.info("[StageOrchestrator] Running manual event compression after implementation loop")
@@ -491,25 +553,19 @@ class StageOrchestratorAgent(BaseAgent):
                         overlap_size=20,
                     )
                 except Exception as compress_err:
-                    logger.warning(f"[StageOrchestrator] Manual compression failed: {compress_err}")
+                    logger.warning("[StageOrchestrator] Manual compression failed: %s", compress_err)
 
             except Exception as e:
                 logger.error(
-                    f"[StageOrchestrator] Implementation loop failed for stage {stage_idx}: {e}",
+                    "[StageOrchestrator] Implementation loop failed for stage %s: %s",
+                    stage_idx,
+                    e,
                     exc_info=True,
                 )
-                error_event = Event(
-                    author=self.name,
-                    content=types.Content(
-                        role="model",
-                        parts=[
-                            types.Part(
-                                text=f"\n\n❌ Implementation loop failed for stage {stage_idx} "
-                                f"({next_stage['title']}): {str(e)}\n\n"
-                                "Skipping to next stage...\n\n"
-                            )
-                        ],
-                    ),
+                error_event = self._text_event(
+                    f"\n\n❌ Implementation loop failed for stage {stage_idx} "
+                    f"({next_stage['title']}): {str(e)}\n\n"
+                    "Skipping to next stage...\n\n",
                     turn_complete=True,
                 )
                 yield error_event
@@ -526,14 +582,17 @@ class StageOrchestratorAgent(BaseAgent):
             approval_reason = decision.get("reason", "") if isinstance(decision, dict) else ""
             if stage_approved:
                 logger.info(
-                    f"[StageOrchestrator] Stage {stage_idx} implementation approved by review. "
-                    f"Reason: {approval_reason}"
+                    "[StageOrchestrator] Stage %s implementation approved by review. Reason: %s",
+                    stage_idx,
+                    approval_reason,
                 )
             else:
                 logger.warning(
-                    f"[StageOrchestrator] Stage {stage_idx} implementation NOT approved by review "
+                    "[StageOrchestrator] Stage %s implementation NOT approved by review "
                     "(implementation loop exhausted its iterations or was halted). "
-                    f"Reason: {approval_reason or 'no approval recorded'}"
+                    "Reason: %s",
+                    stage_idx,
+                    approval_reason or 'no approval recorded',
                 )
 
             # Store implementation result and approval outcome (but don't mark as completed yet)
@@ -542,9 +601,9 @@ class StageOrchestratorAgent(BaseAgent):
             next_stage["status"] = "approved" if stage_approved else "needs_work"
 
             # Add to completed stages history BEFORE running checker/reflector
-            # so they can see the current stage in their prompts
-            stage_implementations = state.get("stage_implementations", [])
-            stage_implementations.append(
+            # so they can see the current stage in their prompts (the list lives in state, so
+            # appending in place is enough)
+            state["stage_implementations"].append(
                 {
                     "stage_index": next_stage["index"],
                     "stage_title": next_stage["title"],
@@ -552,13 +611,12 @@ class StageOrchestratorAgent(BaseAgent):
                     "approved": stage_approved,
                 }
             )
-            state["stage_implementations"] = stage_implementations
 
             # === Run Success Criteria Checker ===
             logger.info("")
             logger.info("")
             logger.info("")
-            logger.info(f"[StageOrchestrator] Running criteria_checker after stage {stage_idx}")
+            logger.info("[StageOrchestrator] Running criteria_checker after stage %s", stage_idx)
 
             try:
                 async for event in self.criteria_checker.run_async(ctx):
@@ -569,25 +627,21 @@ class StageOrchestratorAgent(BaseAgent):
 
                 criteria_met_count = sum(1 for c in criteria if c.get("met", False))
                 logger.info(
-                    f"[StageOrchestrator] Criteria status after check: {criteria_met_count}/{len(criteria)} met"
+                    "[StageOrchestrator] Criteria status after check: %s/%s met",
+                    criteria_met_count,
+                    len(criteria),
                 )
             except Exception as e:
                 logger.error(
-                    f"[StageOrchestrator] Criteria checker failed for stage {stage_idx}: {e}",
+                    "[StageOrchestrator] Criteria checker failed for stage %s: %s",
+                    stage_idx,
+                    e,
                     exc_info=True,
                 )
                 # Log error but continue - criteria check is not mandatory for workflow
-                error_event = Event(
-                    author=self.name,
-                    content=types.Content(
-                        role="model",
-                        parts=[
-                            types.Part(
-                                text=f"\n\n⚠️ Criteria checker failed for stage {stage_idx}: {str(e)}\n"
-                                "Continuing without criteria update...\n\n"
-                            )
-                        ],
-                    ),
+                error_event = self._text_event(
+                    f"\n\n⚠️ Criteria checker failed for stage {stage_idx}: {str(e)}\n"
+                    "Continuing without criteria update...\n\n",
                     turn_complete=False,
                 )
                 yield error_event
@@ -596,7 +650,7 @@ class StageOrchestratorAgent(BaseAgent):
             logger.info("")
             logger.info("")
             logger.info("")
-            logger.info(f"[StageOrchestrator] Running stage_reflector after stage {stage_idx}")
+            logger.info("[StageOrchestrator] Running stage_reflector after stage %s", stage_idx)
 
             try:
                 async for event in self.stage_reflector.run_async(ctx):
@@ -606,21 +660,15 @@ class StageOrchestratorAgent(BaseAgent):
                 stages = state.get("high_level_stages", [])
             except Exception as e:
                 logger.error(
-                    f"[StageOrchestrator] Stage reflector failed for stage {stage_idx}: {e}",
+                    "[StageOrchestrator] Stage reflector failed for stage %s: %s",
+                    stage_idx,
+                    e,
                     exc_info=True,
                 )
                 # Log error but continue - reflection is not mandatory for workflow
-                error_event = Event(
-                    author=self.name,
-                    content=types.Content(
-                        role="model",
-                        parts=[
-                            types.Part(
-                                text=f"\n\n⚠️ Stage reflector failed for stage {stage_idx}: {str(e)}\n"
-                                "Continuing without stage modifications...\n\n"
-                            )
-                        ],
-                    ),
+                error_event = self._text_event(
+                    f"\n\n⚠️ Stage reflector failed for stage {stage_idx}: {str(e)}\n"
+                    "Continuing without stage modifications...\n\n",
                     turn_complete=False,
                 )
                 yield error_event
@@ -632,10 +680,7 @@ class StageOrchestratorAgent(BaseAgent):
             # that review approved it - see next_stage["approved"] / next_stage["status"].
             next_stage["completed"] = True
 
-            # Update stages in state
-            state["high_level_stages"] = stages
-
-            logger.info(f"[StageOrchestrator] Stage {stage_idx} cycle complete. Continuing to next iteration.")
+            logger.info("[StageOrchestrator] Stage %s cycle complete. Continuing to next iteration.", stage_idx)
 
             # Update current_stage_index for tracking (keep 0-indexed for consistency)
             state["current_stage_index"] = stage_idx
@@ -643,23 +688,16 @@ class StageOrchestratorAgent(BaseAgent):
         # Safety exit if max iterations reached
         info = self._apply_terminal_status(state)
         logger.error(
-            f"[StageOrchestrator] Reached maximum iterations ({max_iterations}). "
-            f"Exiting orchestration (status={info['run_status']})."
+            "[StageOrchestrator] Reached maximum iterations (%s). Exiting orchestration (status=%s).",
+            max_iterations,
+            info['run_status'],
         )
         status_block = self._format_status_block(info)
-        timeout_event = Event(
-            author=self.name,
-            content=types.Content(
-                role="model",
-                parts=[
-                    types.Part(
-                        text=f"\n\n⚠️ Reached maximum orchestration iterations ({max_iterations}) "
-                        f"(status: {info['run_status']}). Proceeding to summary with current progress.\n\n"
-                        + (status_block + "\n\n" if status_block else "")
-                    )
-                ],
-            ),
-            actions=EventActions(state_delta=self._status_state_delta(state)),
+        timeout_event = self._text_event(
+            f"\n\n⚠️ Reached maximum orchestration iterations ({max_iterations}) "
+            f"(status: {info['run_status']}). Proceeding to summary with current progress.\n\n"
+            + (status_block + "\n\n" if status_block else ""),
+            state_delta=self._status_state_delta(state),
             turn_complete=True,
         )
         yield timeout_event
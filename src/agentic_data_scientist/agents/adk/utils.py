@@ -5,12 +5,14 @@ This module provides model configuration, helper functions, and shared settings
 for the ADK agent system.
 """
 
+import functools
 import logging
 import os
 from typing import Optional
 
 from dotenv import load_dotenv
 from google.adk.models.lite_llm import LiteLlm
+from google.adk.planners import BuiltInPlanner
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
@@ -45,6 +47,7 @@ __all__ = [
     'OPENROUTER_API_KEY',
     'OPENROUTER_API_BASE',
     'get_generate_content_config',
+    'get_planner',
     'exit_loop_simple',
     'is_network_disabled',
 ]
@@ -56,6 +59,17 @@ if OPENROUTER_API_KEY:
 else:
     logger.warning("[AgenticDS] OPENROUTER_API_KEY not set - using default credentials")
 
+# Prompt caching: mark the system message as a cache breakpoint for providers
+# that support explicit caching (Anthropic, Gemini via OpenRouter). Agents pass
+# the static part of their prompt (see prompts.load_prompt_parts) as
+# static_instruction, which ADK sends as the system message without state
+# injection; the {state?} context block goes to instruction, which ADK then
+# sends as user content. The cached prefix therefore stays byte-identical
+# across loop iterations even as implementation_task or plan_verdict change.
+# Keep each prompt's placeholders in its final context section so the split
+# lands before them.
+PROMPT_CACHE_INJECTION_POINTS = [{"location": "message", "role": "system"}]
+
 # Create LiteLLM model instances
 # LiteLLM will automatically route through OpenRouter when model names have the provider prefix (e.g., "google/", "anthropic/")
 DEFAULT_MODEL = LiteLlm(
@@ -65,6 +79,7 @@ DEFAULT_MODEL = LiteLlm(
     # Additional OpenRouter-specific headers
     api_base=OPENROUTER_API_BASE if OPENROUTER_API_KEY else None,
     custom_llm_provider="openrouter" if OPENROUTER_API_KEY else None,
+    cache_control_injection_points=PROMPT_CACHE_INJECTION_POINTS,
 )
 
 REVIEW_MODEL = LiteLlm(
@@ -73,11 +88,21 @@ REVIEW_MODEL = LiteLlm(
     timeout=60,
     api_base=OPENROUTER_API_BASE if OPENROUTER_API_KEY else None,
     custom_llm_provider="openrouter" if OPENROUTER_API_KEY else None,
+    cache_control_injection_points=PROMPT_CACHE_INJECTION_POINTS,
 )
 
 # Language requirement (empty for English-only models)
 LANGUAGE_REQUIREMENT = ""
 
+# Thinking budgets per agent role (-1 lets the model decide, i.e. unbounded).
+# Planning keeps an unbounded budget; reviewers, the summary writer and the
+# structured exit/continue decisions get bounded budgets since extra thinking
+# mostly adds latency there.
+PLANNING_THINKING_BUDGET = -1
+SUMMARY_THINKING_BUDGET = 4096
+REVIEW_THINKING_BUDGET = 2048
+CONFIRMATION_THINKING_BUDGET = 1024
+
 
 def is_network_disabled() -> bool:
     """
@@ -122,10 +147,42 @@ def exit_loop_simple(tool_context: ToolContext):
     return {}
 
 
+@functools.lru_cache(maxsize=None)
+def get_planner(thinking_budget: int = PLANNING_THINKING_BUDGET) -> BuiltInPlanner:
+    """
+    Create a BuiltInPlanner that streams thoughts with the given thinking budget.
+
+    Planners are stateless, so one instance per budget is cached and shared by
+    every agent that uses it.
+
+    Parameters
+    ----------
+    thinking_budget : int, optional
+        Maximum thinking tokens per model call, or -1 for no limit
+        (default: PLANNING_THINKING_BUDGET)
+
+    Returns
+    -------
+    BuiltInPlanner
+        Planner configured with ``include_thoughts=True``
+    """
+    return BuiltInPlanner(
+        thinking_config=types.ThinkingConfig(
+            include_thoughts=True,
+            thinking_budget=thinking_budget,
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=16)
 def get_generate_content_config(temperature: float = 0.0, output_tokens: Optional[int] = None):
     """
     Create a GenerateContentConfig with retry settings.
 
+    Configs are cached per argument combination and shared between agents.
+    ADK copies the config for every model request, so the shared instance is
+    never mutated; callers must not modify it either.
+
     Parameters
     ----------
     temperature : float, optional
@@ -4,40 +4,265 @@ Agentic Data Scientist CLI interface.
 Simple command-line interface for running Agentic Data Scientist agents.
 """
 
+import asyncio
+import errno
 import logging
 import os
+import stat
 import sys
+from logging.handlers import MemoryHandler
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import click
 
-from agentic_data_scientist import DataScientist
 
+logger = logging.getLogger(__name__)
 
-# Suppress third-party library console output early, before importing our modules
-# This prevents libraries like LiteLLM from setting up their own console handlers
-for lib_name in ['LiteLLM', 'litellm', 'httpx', 'httpcore', 'openai', 'anthropic', 'google_adk']:
-    lib_logger = logging.getLogger(lib_name)
-    lib_logger.setLevel(logging.WARNING)  # Only warnings and above
-    lib_logger.propagate = False  # Don't propagate to root logger yet
+# Number of log records buffered before they are written to the log file. Kept
+# small so the file stays close to live for `tail -f` and a hard crash loses
+# only the last few records.
+LOG_BUFFER_CAPACITY = 16
 
+# Formatters are stateless, so one instance of each is shared by every handler
+FILE_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+CONSOLE_LOG_FORMATTER = logging.Formatter('%(message)s')  # Simpler format for console
 
-os.environ['LITELLM_LOG'] = 'ERROR'  # Only show errors from LiteLLM
+# stat() errors that mean "nothing usable at this path", as Path.exists() treats them
+# (e.g. ELOOP for symlinks pointing at each other)
+MISSING_PATH_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
 
-# Try to suppress LiteLLM's verbose output if the module is available
-try:
-    import litellm
+THIRD_PARTY_LOGGERS = ('LiteLLM', 'litellm', 'httpx', 'httpcore', 'openai', 'anthropic', 'google_adk')
 
-    litellm.suppress_debug_info = True
-    litellm.drop_params = True
-    litellm.turn_off_message_logging = True
-except (ImportError, AttributeError):
-    # LiteLLM not installed yet or attributes don't exist, will be configured later
-    pass
 
+class _DeferredFlushFileHandler(logging.FileHandler):
+    """
+    File handler that only flushes its stream for errors or when asked to.
 
-logger = logging.getLogger(__name__)
+    ``StreamHandler.emit`` flushes after every record, so a batch written out by
+    the ``MemoryHandler`` in front of it would still cost a write per record.
+    Records below ERROR are left in the file buffer until ``_BatchMemoryHandler``
+    flushes the stream at the end of the batch.
+    """
+
+    _defer_flush = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._defer_flush = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+
+    def flush(self) -> None:
+        if not self._defer_flush:
+            super().flush()
+
+
+class _BatchMemoryHandler(MemoryHandler):
+    """``MemoryHandler`` that flushes its target's stream once after each batch."""
+
+    def flush(self) -> None:
+        super().flush()
+        if self.target is not None:
+            self.target.flush()
+
+
+def _configure_third_party_logging() -> None:
+    """
+    Keep third-party libraries off the console before the agent stack is imported.
+
+    This must run before ``DataScientist`` is imported so libraries like LiteLLM
+    do not set up their own console handlers. It is called from ``main()``
+    rather than at import time so ``--help`` and argument errors never pay for
+    importing the LLM stack.
+    """
+    for lib_name in THIRD_PARTY_LOGGERS:
+        lib_logger = logging.getLogger(lib_name)
+        lib_logger.setLevel(logging.WARNING)  # Only warnings and above
+        lib_logger.propagate = False  # Don't propagate to root logger yet
+
+    # Only show errors from LiteLLM, unless the user asked for a different level
+    os.environ.setdefault('LITELLM_LOG', 'ERROR')
+
+
+def _install_uvloop() -> None:
+    """Run the agent on uvloop's event loop when the optional ``uvloop`` extra is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _collect_directory_files(directory: Path) -> List[Tuple[str, str]]:
+    """
+    Recursively list the files under ``directory`` with ``os.scandir``.
+
+    Directory entries carry their file type, so regular files and directories
+    are told apart without an extra ``stat`` per entry. Symlinked files are
+    included; symlinked directories are not descended into.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory to walk
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        ``(relative_name, path)`` string pairs, where ``relative_name``
+        preserves the structure below ``directory``
+    """
+    files: List[Tuple[str, str]] = []
+    stack = [(os.fspath(directory), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                relative_name = os.path.join(prefix, entry.name) if prefix else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, relative_name))
+                elif entry.is_file():
+                    files.append((relative_name, entry.path))
+    return files
+
+
+def _suppress_litellm_output() -> None:
+    """Turn off LiteLLM's verbose output if the module is available."""
+    try:
+        import litellm
+
+        litellm.suppress_debug_info = True
+        litellm.drop_params = True
+        litellm.turn_off_message_logging = True
+    except (ImportError, AttributeError):
+        pass
+
+
+def _prepare_file_list(files: tuple) -> List[Tuple[str, str]]:
+    """
+    Resolve ``--files`` arguments into ``(name, path)`` pairs for upload.
+
+    Missing paths are reported and skipped; directories are expanded
+    recursively. Arguments that resolve to the same file or directory (e.g.
+    ``data/`` and ``./data``) are only processed once, and a file reached
+    through overlapping arguments (e.g. ``data`` and ``data/raw.csv``) is only
+    uploaded under its first name.
+
+    Parameters
+    ----------
+    files : tuple
+        Paths given with ``--files``
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        ``(name, path)`` string pairs for ``DataScientist.run``, which
+        accepts source paths as ``str``
+    """
+    file_list = []
+    seen_paths = set()
+    for f in files:
+        path = Path(f)
+        # One stat answers both "does it exist" and "is it a directory"
+        try:
+            mode = os.stat(path).st_mode
+        except OSError as e:
+            if e.errno not in MISSING_PATH_ERRNOS:
+                raise
+            click.echo(f"Warning: File not found: {f}", err=True)
+            continue
+
+        # Skip repeated arguments so the same files aren't walked and uploaded twice
+        real_path = os.path.realpath(path)
+        if real_path in seen_paths:
+            continue
+        seen_paths.add(real_path)
+
+        # Handle directory - recursively add all files
+        if stat.S_ISDIR(mode):
+            # Preserve relative path structure from the directory being uploaded
+            directory_files = _collect_directory_files(path)
+            file_list.extend(directory_files)
+            files_found = len(directory_files)
+
+            if files_found > 0:
+                click.echo(f"Found {files_found} file(s) in directory: {path}")
+            else:
+                click.echo(f"Warning: No files found in directory: {path}", err=True)
+        else:
+            # Handle single file
+            file_list.append((path.name, f))
+
+    # A file may also be reached through overlapping arguments; keep its first entry.
+    # Paths are only normalized (not resolved), so symlinked aliases are kept.
+    unique_files = []
+    seen_sources = set()
+    for name, source in file_list:
+        source_path = os.path.abspath(source)
+        if source_path not in seen_sources:
+            seen_sources.add(source_path)
+            unique_files.append((name, source))
+    return unique_files
+
+
+def _configure_logging(log_path: Path, verbose: bool) -> MemoryHandler:
+    """
+    Send all logs to ``log_path`` and user-facing app logs to the console.
+
+    Parameters
+    ----------
+    log_path : Path
+        Log file to write (truncated first)
+    verbose : bool
+        Log at DEBUG instead of INFO
+
+    Returns
+    -------
+    MemoryHandler
+        The buffering handler in front of the log file, to flush on exit
+    """
+    # Configure file handler for all logs. Records are buffered in memory and written
+    # in batches (immediately for errors) so verbose runs don't issue a write per record.
+    file_handler = _DeferredFlushFileHandler(log_path, mode='w')
+    file_handler.setFormatter(FILE_LOG_FORMATTER)
+    buffered_file_handler = _BatchMemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+    buffered_file_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+    # Configure root logger - file only, remove any default console handlers
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    # Remove existing handlers (like default StreamHandler)
+    root_logger.handlers.clear()
+    root_logger.addHandler(buffered_file_handler)
+
+    # Configure console handler for important user-facing messages
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(CONSOLE_LOG_FORMATTER)
+
+    # Add console handler only to agentic_data_scientist loggers
+    app_logger = logging.getLogger('agentic_data_scientist')
+    app_logger.addHandler(console_handler)
+    app_logger.propagate = True  # Still send to root logger (file)
+
+    # Re-enable propagation for third-party libraries so they go to log file
+    # but keep them off the console
+    for lib_name in THIRD_PARTY_LOGGERS:
+        lib_logger = logging.getLogger(lib_name)
+        lib_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+        lib_logger.handlers.clear()  # Remove any console handlers
+        lib_logger.propagate = True  # Send to root logger (file only)
+
+    # Called once the agent stack (and with it LiteLLM) has been imported
+    _suppress_litellm_output()
+
+    return buffered_file_handler
 
 
 @click.command()
@@ -134,6 +359,9 @@ def main(
         Verbose logging:
             agentic-data-scientist "Debug issue" --mode simple --files data.csv --verbose
     """
+    _configure_third_party_logging()
+    _install_uvloop()
+
     # Set logging level
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -147,30 +375,7 @@ def main(
             sys.exit(1)
 
     # Prepare file list
-    file_list = []
-    for f in files:
-        path = Path(f)
-        if not path.exists():
-            click.echo(f"Warning: File not found: {f}", err=True)
-            continue
-
-        # Handle directory - recursively add all files
-        if path.is_dir():
-            files_found = 0
-            for file_path in path.rglob('*'):
-                if file_path.is_file():
-                    # Preserve relative path structure from the directory being uploaded
-                    relative_name = file_path.relative_to(path)
-                    file_list.append((str(relative_name), file_path))
-                    files_found += 1
-
-            if files_found > 0:
-                click.echo(f"Found {files_found} file(s) in directory: {path}")
-            else:
-                click.echo(f"Warning: No files found in directory: {path}", err=True)
-        else:
-            # Handle single file
-            file_list.append((path.name, path))
+    file_list = _prepare_file_list(files)
 
     # Map mode to agent_type
     agent_type = "adk" if mode == "orchestrated" else "claude_code"
@@ -187,10 +392,13 @@ def main(
     else:
         # Default to ./agentic_output/ with no cleanup
         working_dir_to_use = "./agentic_output"
-        auto_cleanup = not keep_files if keep_files else False
+        auto_cleanup = False
 
     # Create core instance
     try:
+        # Imported here so the LLM stack is only loaded once there is work to do
+        from agentic_data_scientist import DataScientist
+
         core = DataScientist(
             agent_type=agent_type,
             working_dir=working_dir_to_use,
@@ -207,61 +415,21 @@ def main(
         # Create parent directories if needed
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Configure file handler for all logs
-        file_handler = logging.FileHandler(log_path, mode='w')
-        file_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-
-        # Configure root logger - file only, remove any default console handlers
-        root_logger = logging.getLogger()
-        root_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
-        # Remove existing handlers (like default StreamHandler)
-        root_logger.handlers.clear()
-        root_logger.addHandler(file_handler)
-
-        # Configure console handler for important user-facing messages
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(
-            logging.Formatter('%(message)s')  # Simpler format for console
-        )
-
-        # Add console handler only to agentic_data_scientist loggers
-        app_logger = logging.getLogger('agentic_data_scientist')
-        app_logger.addHandler(console_handler)
-        app_logger.propagate = True  # Still send to root logger (file)
-
-        # Re-enable propagation for third-party libraries so they go to log file
-        # but keep them off the console
-        for lib_name in ['LiteLLM', 'litellm', 'httpx', 'httpcore', 'openai', 'anthropic', 'google_adk']:
-            lib_logger = logging.getLogger(lib_name)
-            lib_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
-            lib_logger.handlers.clear()  # Remove any console handlers
-            lib_logger.propagate = True  # Send to root logger (file only)
-
-        # Re-apply LiteLLM suppression settings in case it was imported
-        try:
-            import litellm
-
-            litellm.suppress_debug_info = True
-            litellm.drop_params = True
-            litellm.turn_off_message_logging = True
-        except (ImportError, AttributeError):
-            pass
+        buffered_file_handler = _configure_logging(log_path, verbose)
 
         # Display working directory information
         if temp_dir:
-            click.echo(f"Working directory (temporary): {core.working_dir}")
-            click.echo("Files will be cleaned up after completion")
+            banner = [f"Working directory (temporary): {core.working_dir}", "Files will be cleaned up after completion"]
         else:
-            click.echo(f"Working directory: {core.working_dir}")
+            banner = [f"Working directory: {core.working_dir}"]
             if core.auto_cleanup:
-                click.echo("Files will be cleaned up after completion")
+                banner.append("Files will be cleaned up after completion")
             else:
-                click.echo("Files will be preserved after completion")
+                banner.append("Files will be preserved after completion")
 
-        click.echo(f"Logs: {log_path}")
-        click.echo("")
+        banner.append(f"Logs: {log_path}")
+        banner.append("")
+        click.echo("\n".join(banner))
 
     except Exception as e:
         click.echo(f"Error initializing Agentic Data Scientist: {e}", err=True)
@@ -271,37 +439,36 @@ def main(
     try:
         result = core.run(query, files=file_list)
         if result.status != "error":
-            click.echo("\n" + "=" * 60)
-            click.echo("RESPONSE:")
-            click.echo("=" * 60)
-            click.echo(result.response)
-            click.echo("\n" + "=" * 60)
+            separator = "=" * 60
+            lines = ["\n" + separator, "RESPONSE:", separator, result.response, "\n" + separator]
 
             # Surface the truthful run status so success isn't assumed.
             if result.status == "completed":
-                click.echo("\nStatus: completed (all success criteria met)")
+                lines.append("\nStatus: completed (all success criteria met)")
             elif result.status == "completed_with_warnings":
-                click.echo(
+                lines.append(
                     "\n⚠️  Status: completed with warnings - all success criteria were met, but some "
                     "stages did not pass review. See the report above for details."
                 )
             elif result.status == "incomplete":
-                click.echo(
+                lines.append(
                     "\n⚠️  Status: incomplete - not all success criteria were met. "
                     "See the report above for what was accomplished and what remains."
                 )
             else:
-                click.echo(f"\nStatus: {result.status}")
+                lines.append(f"\nStatus: {result.status}")
 
             if result.files_created:
-                click.echo(f"\nFiles created ({len(result.files_created)}):")
-                for file in result.files_created:
-                    click.echo(f"  - {file}")
-            click.echo(f"\nDuration: {result.duration:.2f}s")
-            click.echo(f"Session ID: {result.session_id}")
-            click.echo(f"Working directory: {core.working_dir}")
+                lines.append(f"\nFiles created ({len(result.files_created)}):")
+                lines.extend(f"  - {file}" for file in result.files_created)
+            lines.append(f"\nDuration: {result.duration:.2f}s")
+            lines.append(f"Session ID: {result.session_id}")
+            lines.append(f"Working directory: {core.working_dir}")
             if not core.auto_cleanup:
-                click.echo(f"\nFiles preserved at: {core.working_dir}")
+                lines.append(f"\nFiles preserved at: {core.working_dir}")
+
+            # Print the whole report in one write so piped output stays contiguous
+            click.echo("\n".join(lines))
         else:
             click.echo(f"\nError: {result.error}", err=True)
             sys.exit(1)
@@ -318,6 +485,8 @@ def main(
             core.cleanup()
         except Exception as e:
             logger.warning(f"Cleanup error: {e}")
+        # Write out buffered log records (logging.shutdown() also flushes them at exit)
+        buffered_file_handler.flush()
 
 
 if __name__ == '__main__':
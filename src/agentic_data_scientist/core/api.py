@@ -6,12 +6,17 @@ with optional conversation context and file handling.
 """
 
 import asyncio
+import json
 import logging
+import os
 import uuid
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from dotenv import load_dotenv
 from google.adk.runners import Runner
@@ -35,6 +40,61 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 logging.getLogger("google_adk.google.adk.tools.base_authenticated_tool").setLevel(logging.ERROR)
 
+# Upper bound on worker threads used for blocking tool calls and executor fallbacks
+MAX_WORKER_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+# Event loops already checked by _install_bounded_executor (shared by every DataScientist)
+_bounded_executor_loops = weakref.WeakSet()
+
+
+def _run_coroutine_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    ``asyncio.run`` refuses to start while another event loop is running in the
+    current thread (e.g. Jupyter or an async web worker calling the sync API). In
+    that case the coroutine is run on a fresh loop in a worker thread instead.
+
+    Parameters
+    ----------
+    coro : Coroutine
+        The coroutine to run
+
+    Returns
+    -------
+    Any
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agentic-ds-sync") as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _install_bounded_executor():
+    """
+    Install a bounded, named thread pool as the running loop's default executor.
+
+    Blocking tool calls are offloaded with ``asyncio.to_thread`` (and LiteLLM
+    falls back to ``run_in_executor(None, ...)``), which both use the loop's
+    default executor. Installing a pool capped at ``MAX_WORKER_THREADS`` keeps
+    thread growth predictable under concurrent and batched runs.
+
+    Each loop is handled once, no matter how many instances run on it, and a
+    default executor that the application (or asyncio) already set up is never
+    replaced. The loop owns the pool and shuts it down when it closes.
+    """
+    loop = asyncio.get_running_loop()
+    if loop in _bounded_executor_loops:
+        return
+    _bounded_executor_loops.add(loop)
+    if getattr(loop, "_default_executor", None) is not None:
+        return
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=MAX_WORKER_THREADS, thread_name_prefix="agentic-ds"))
+
 
 @dataclass
 class SessionConfig:
@@ -132,6 +192,9 @@ class DataScientist:
         self.session_service = None
         self.runner = None
 
+        # Top-level working directory folders that hold batch worker outputs
+        self._batch_dir_names = set()
+
         logger.info(f"Initialized Agentic Data Scientist session: {self.session_id}")
         logger.info(f"Working directory: {self.working_dir}")
         logger.info(f"Auto-cleanup enabled: {self.auto_cleanup}")
@@ -366,7 +429,6 @@ class DataScientist:
         """Stream responses from the agent."""
         event_count = 0
         message_event_number = 0
-        responses = []
 
         try:
             # Pass initial state to runner via state_delta
@@ -404,7 +466,6 @@ class DataScientist:
                                     event_number=message_event_number,
                                 )
                                 yield event_to_dict(msg_event)
-                                responses.append(f"[{event.author}]: {part.text}")
 
                             # Handle function calls
                             if hasattr(part, 'function_call') and part.function_call:
@@ -413,8 +474,6 @@ class DataScientist:
                                     args = {}
                                     if hasattr(fc, 'args') and fc.args:
                                         try:
-                                            import json
-
                                             args = json.loads(fc.args) if isinstance(fc.args, str) else fc.args
                                         except Exception:
                                             args = {'raw': str(fc.args)}
@@ -459,15 +518,7 @@ class DataScientist:
             # Calculate duration
             duration = (datetime.now() - start_time).total_seconds()
 
-            # Find created files (exclude hidden directories like .venv, .claude)
-            files_created = []
-            if self.working_dir.exists():
-                for file_path in self.working_dir.rglob('*'):
-                    if file_path.is_file() and 'user_data' not in file_path.parts:
-                        # Exclude hidden directories (starting with .)
-                        if not any(part.startswith('.') for part in file_path.parts):
-                            relative_path = file_path.relative_to(self.working_dir)
-                            files_created.append(str(relative_path))
+            files_created = self._list_created_files()
 
             # Final completed event (status reflects the orchestrator's recorded outcome)
             run_status = await self._resolve_run_status()
@@ -487,6 +538,25 @@ class DataScientist:
             error_event = ErrorEvent(content=str(e), timestamp=datetime.now().strftime("%H:%M:%S.%f")[:-3])
             yield event_to_dict(error_event)
 
+    def _list_created_files(self) -> List[str]:
+        """
+        List the files in the working directory, relative to it.
+
+        Uploaded files (``user_data``), hidden directories (like .venv, .claude)
+        and the output folders of this instance's batch workers are excluded.
+        """
+        files_created = []
+        if self.working_dir.exists():
+            for file_path in self.working_dir.rglob('*'):
+                if file_path.is_file() and 'user_data' not in file_path.parts:
+                    relative_path = file_path.relative_to(self.working_dir)
+                    # Exclude hidden directories (starting with .) and batch worker folders
+                    if relative_path.parts[0] in self._batch_dir_names:
+                        continue
+                    if not any(part.startswith('.') for part in file_path.parts):
+                        files_created.append(str(relative_path))
+        return files_created
+
     async def _resolve_run_status(self, default: str = "completed") -> str:
         """
         Read the terminal run status the orchestrator recorded in session state.
@@ -555,15 +625,7 @@ class DataScientist:
             # Calculate duration
             duration = (datetime.now() - start_time).total_seconds()
 
-            # Find created files (exclude hidden directories like .venv, .claude)
-            files_created = []
-            if self.working_dir.exists():
-                for file_path in self.working_dir.rglob('*'):
-                    if file_path.is_file() and 'user_data' not in file_path.parts:
-                        # Exclude hidden directories (starting with .)
-                        if not any(part.startswith('.') for part in file_path.parts):
-                            relative_path = file_path.relative_to(self.working_dir)
-                            files_created.append(str(relative_path))
+            files_created = self._list_created_files()
 
             # Derive status from the orchestrator's recorded outcome rather than
             # always reporting success.
@@ -605,7 +667,188 @@ class DataScientist:
         Result
             The complete response
         """
-        return asyncio.run(self.run_async(message, files, stream=False, **kwargs))
+        return _run_coroutine_sync(self._with_bounded_executor(self.run_async(message, files, stream=False, **kwargs)))
+
+    async def _with_bounded_executor(self, coro):
+        """Await ``coro`` after installing the bounded default executor on the current loop."""
+        _install_bounded_executor()
+        return await coro
+
+    def _spawn_batch_worker(self, batch_dir: Path, index: int) -> "DataScientist":
+        """
+        Create an isolated DataScientist for one item of a batch.
+
+        Each worker gets its own session and an ``item_<index>`` folder inside the
+        batch's own ``batch_<id>`` directory, so runs never share session state or
+        output files, not even with other batches on the same instance.
+        """
+        return DataScientist(
+            agent_type=self.config.agent_type,
+            mcp_servers=self.config.mcp_servers,
+            working_dir=str(batch_dir / f"item_{index:03d}"),
+            auto_cleanup=False,
+        )
+
+    async def _run_batch_item(
+        self,
+        batch_dir: Path,
+        index: int,
+        message: str,
+        files: Optional[List[tuple]],
+        context: Optional[Dict],
+        retries: int,
+    ) -> Tuple[int, Result]:
+        """Run one batch item in its own worker session, retrying error results."""
+        result = None
+        for attempt in range(retries + 1):
+            worker = None
+            try:
+                # Fresh worker per attempt, so a retry never inherits the failed run's session
+                worker = self._spawn_batch_worker(batch_dir, index)
+                item_context = dict(context) if context is not None else None
+                result = await worker.run_async(message, files, stream=False, context=item_context)
+            except Exception as e:
+                logger.error(f"[API] Batch item {index} raised: {e}", exc_info=True)
+                session_id = worker.session_id if worker is not None else self.session_id
+                result = Result(session_id=session_id, status="error", error=str(e))
+            if result.status != "error":
+                break
+            if attempt < retries:
+                logger.warning(f"[API] Batch item {index} failed, retrying ({attempt + 1}/{retries})")
+        return index, result
+
+    async def run_batch_as_completed(
+        self,
+        messages: List[str],
+        files: Optional[List[tuple]] = None,
+        max_concurrency: int = 4,
+        retries: int = 0,
+        context: Optional[Dict] = None,
+    ) -> AsyncIterator[Tuple[int, Result]]:
+        """
+        Run several independent queries concurrently, yielding results as they finish.
+
+        Every message is executed in its own session and output folder (see
+        ``_spawn_batch_worker``). The batch's folders are excluded from the
+        ``files_created`` of this instance's own runs.
+        At most ``max_concurrency`` runs are in flight; as soon as any run
+        finishes, the next queued message is started in its slot and the finished
+        result is yielded, so callers can post-process results before the whole
+        batch is done. Failures are reported per item as error results rather than
+        aborting the batch.
+
+        Parameters
+        ----------
+        messages : List[str]
+            Independent user messages/prompts
+        files : List[tuple], optional
+            List of (filename, content) tuples made available to every run
+        max_concurrency : int, optional
+            Maximum number of runs executing at the same time (default: 4)
+        retries : int, optional
+            Number of additional attempts for a run that ends with status
+            "error" (default: 0). Every attempt runs in a fresh session
+        context : Dict, optional
+            Conversation context passed (as a copy) to every run
+
+        Yields
+        ------
+        Tuple[int, Result]
+            Index of the message in ``messages`` and its result, in completion order
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        logger.info(f"[API] Running batch of {len(messages)} queries (max_concurrency={max_concurrency})")
+
+        batch_dir_name = f"batch_{uuid.uuid4().hex[:8]}"
+        self._batch_dir_names.add(batch_dir_name)
+        batch_dir = self.working_dir / batch_dir_name
+
+        pending = deque(enumerate(messages))
+        in_flight = set()
+        task_indices = {}
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < max_concurrency:
+                    index, message = pending.popleft()
+                    task = asyncio.create_task(self._run_batch_item(batch_dir, index, message, files, context, retries))
+                    task_indices[task] = index
+                    in_flight.add(task)
+
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = task_indices.pop(task)
+                    try:
+                        item_result = task.result()
+                    except Exception as e:
+                        # Anything that escaped the item's own error handling still only fails that item
+                        logger.error(f"[API] Batch item {index} failed: {e}", exc_info=True)
+                        item_result = index, Result(session_id=self.session_id, status="error", error=str(e))
+                    yield item_result
+        finally:
+            # Caller stopped iterating early (break/cancel): don't leave runs behind
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def run_batch_async(
+        self,
+        messages: List[str],
+        files: Optional[List[tuple]] = None,
+        max_concurrency: int = 4,
+        retries: int = 0,
+        context: Optional[Dict] = None,
+    ) -> List[Result]:
+        """
+        Run several independent queries concurrently.
+
+        Scheduling is the same as ``run_batch_as_completed``; this method waits
+        for the whole batch and returns the results in input order.
+
+        Parameters
+        ----------
+        messages : List[str]
+            Independent user messages/prompts
+        files : List[tuple], optional
+            List of (filename, content) tuples made available to every run
+        max_concurrency : int, optional
+            Maximum number of runs executing at the same time (default: 4)
+        retries : int, optional
+            Number of additional attempts for a run that ends with status
+            "error" (default: 0). Every attempt runs in a fresh session
+        context : Dict, optional
+            Conversation context passed (as a copy) to every run
+
+        Returns
+        -------
+        List[Result]
+            One result per message, in the same order as ``messages``
+        """
+        results: List[Optional[Result]] = [None] * len(messages)
+        async for index, result in self.run_batch_as_completed(messages, files, max_concurrency, retries, context):
+            results[index] = result
+        return results
+
+    def run_batch(self, messages: List[str], files: Optional[List[tuple]] = None, **kwargs) -> List[Result]:
+        """
+        Synchronous wrapper for run_batch_async.
+
+        Parameters
+        ----------
+        messages : List[str]
+            Independent user messages/prompts
+        files : List[tuple], optional
+            List of (filename, content) tuples made available to every run
+        **kwargs
+            Additional arguments passed to run_batch_async
+
+        Returns
+        -------
+        List[Result]
+            One result per message, in the same order as ``messages``
+        """
+        return _run_coroutine_sync(self._with_bounded_executor(self.run_batch_async(messages, files, **kwargs)))
 
     def cleanup(self):
         """Clean up working directory if auto_cleanup is enabled."""
@@ -632,6 +875,7 @@ class DataScientist:
 
     async def __aenter__(self):
         """Async context manager entry."""
+        _install_bounded_executor()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
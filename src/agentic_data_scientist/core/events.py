@@ -4,6 +4,7 @@ Event data models for Agentic Data Scientist streaming responses.
 Provides structured definitions for all event types used in the streaming interface.
 """
 
+import functools
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
@@ -159,6 +160,12 @@ def create_event(event_type: str, **kwargs) -> StreamingEvent:
     return event_class(**filtered_kwargs)
 
 
+@functools.lru_cache(maxsize=None)
+def _payload_fields(event_class: type) -> tuple[str, ...]:
+    """Return the field names serialized for an event class (all fields except ``type``)."""
+    return tuple(name for name in event_class.__dataclass_fields__ if name != "type")
+
+
 def event_to_dict(event: StreamingEvent) -> Dict[str, Any]:
     """
     Convert an event to a dictionary for JSON serialization.
@@ -176,9 +183,9 @@ def event_to_dict(event: StreamingEvent) -> Dict[str, Any]:
     result = {"type": event.type}
 
     # Add all non-None fields
-    for field_name in event.__dataclass_fields__:
+    for field_name in _payload_fields(type(event)):
         value = getattr(event, field_name)
-        if value is not None and field_name != "type":
+        if value is not None:
             result[field_name] = value
 
     return result
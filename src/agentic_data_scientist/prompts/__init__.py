@@ -1,13 +1,23 @@
 """Prompt templates and loading utilities."""
 
+import functools
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 
+# Matches ADK state placeholders such as {original_user_input?}
+_STATE_PLACEHOLDER = re.compile(r"\{[A-Za-z_][A-Za-z0-9_]*\??\}")
+
+
+@functools.lru_cache(maxsize=64)
 def load_prompt(name: str, domain: Optional[str] = None) -> str:
     """
     Load prompt template by name.
 
+    Results are cached per (name, domain), so repeated agent construction
+    reads each prompt file from disk only once per process.
+
     Parameters
     ----------
     name : str
@@ -38,4 +48,43 @@ def load_prompt(name: str, domain: Optional[str] = None) -> str:
     return prompt_path.read_text()
 
 
-__all__ = ["load_prompt"]
+def load_prompt_parts(name: str, domain: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Load a prompt template split into its static part and its context block.
+
+    Every prompt in prompts/base lists its static sections first and ends with a
+    context section holding the {state?} placeholders. The split is made at the
+    heading that introduces the first placeholder, so the static part can be
+    passed to ``LlmAgent(static_instruction=...)`` and stay byte-identical
+    across loop iterations, while the context block goes to ``instruction``.
+
+    Parameters
+    ----------
+    name : str
+        Prompt name (e.g., 'plan_generator', 'coding_review')
+    domain : str, optional
+        Optional domain namespace (e.g., 'bioinformatics')
+
+    Returns
+    -------
+    Tuple[str, str]
+        (static_part, context_part). context_part is empty when the prompt
+        has no state placeholders.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the prompt file doesn't exist
+    """
+    prompt = load_prompt(name, domain)
+
+    match = _STATE_PLACEHOLDER.search(prompt)
+    if match is None:
+        return prompt, ""
+
+    heading = prompt.rfind("\n# ", 0, match.start())
+    split_at = heading + 1 if heading != -1 else prompt.rfind("\n", 0, match.start()) + 1
+    return prompt[:split_at].rstrip() + "\n", prompt[split_at:]
+
+
+__all__ = ["load_prompt", "load_prompt_parts"]
@@ -4,9 +4,107 @@ Web operation tools for ADK agents.
 Provides HTTP GET functionality with timeout and user-agent configuration.
 """
 
-from typing import Optional
+import http.cookiejar
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+
+# Connection pool sizing for the shared session: number of hosts kept and
+# connections kept per host
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 100
+
+# Shared session so repeated fetches reuse keep-alive connections (and TLS
+# sessions) instead of opening a new connection per call. Only the connection
+# pool is shared: the jar rejects all cookies, so no Set-Cookie from one fetch
+# is sent on later fetches (cookies still work within a redirect chain).
+_http_session = requests.Session()
+_http_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_http_adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+_http_session.mount("http://", _http_adapter)
+_http_session.mount("https://", _http_adapter)
+
+# Maximum number of response bytes downloaded per fetch; larger bodies are cut off
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+# Size of the chunks read from the response stream
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# Number of responses remembered for conditional requests (ETag / Last-Modified)
+RESPONSE_CACHE_SIZE = 128
+
+# Upper bound on the characters of response text held by the cache in total
+RESPONSE_CACHE_MAX_CHARS = 8 * 1024 * 1024
+
+# (url, user_agent) -> (validator request headers, response text), least recently used first
+_response_cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[Dict[str, str], str]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _get_cached_response(key: Tuple[str, Optional[str]]) -> Optional[Tuple[Dict[str, str], str]]:
+    """Return the cached validators and text for ``key``, marking it recently used."""
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+        return cached
+
+
+def _cache_response(key: Tuple[str, Optional[str]], response: requests.Response, text: str) -> None:
+    """Remember ``text`` for ``key`` if the response carries cache validators."""
+    validators = {}
+    etag = response.headers.get("ETag")
+    if etag:
+        validators["If-None-Match"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    if not validators or len(text) > RESPONSE_CACHE_MAX_CHARS:
+        return
+
+    with _response_cache_lock:
+        _response_cache[key] = (validators, text)
+        _response_cache.move_to_end(key)
+        # Evict least recently used entries until both the entry and size limits hold
+        cached_chars = sum(len(cached_text) for _, cached_text in _response_cache.values())
+        while len(_response_cache) > RESPONSE_CACHE_SIZE or cached_chars > RESPONSE_CACHE_MAX_CHARS:
+            _, (_, evicted_text) = _response_cache.popitem(last=False)
+            cached_chars -= len(evicted_text)
+
+
+def _read_capped_text(response: requests.Response, max_bytes: int) -> Tuple[str, bool]:
+    """
+    Read and decode at most ``max_bytes`` of a streamed response body.
+
+    Parameters
+    ----------
+    response : requests.Response
+        Response opened with ``stream=True``
+    max_bytes : int
+        Maximum number of body bytes to read
+
+    Returns
+    -------
+    tuple of (str, bool)
+        Decoded text and whether the body was cut off at ``max_bytes``
+    """
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            break
+
+    body = b"".join(chunks)
+    cut_off = len(body) > max_bytes
+    if cut_off:
+        body = body[:max_bytes]
+    return body.decode(response.encoding or "utf-8", errors="replace"), cut_off
 
 
 def _truncate_content(content: str, max_content_length: int) -> str:
@@ -68,7 +166,11 @@ def fetch_url(
     -----
     - Only HTTP and HTTPS protocols are supported
     - Follows redirects automatically
-    - Returns text content with automatic encoding detection
+    - Reuses pooled connections across calls
+    - Revalidates previously fetched URLs with ETag / Last-Modified and reuses
+      the cached content on ``304 Not Modified``
+    - Returns text content decoded with the charset declared by the server
+    - Downloads at most MAX_RESPONSE_BYTES of the response body
     - Returns error message for failed requests
     - Content exceeding max_content_length will be truncated with a warning message
 
@@ -93,19 +195,40 @@ def fetch_url(
         if user_agent is not None:
             headers["User-Agent"] = user_agent
 
-        # Make the request
-        response = requests.get(
+        # Revalidate previously fetched content instead of downloading it again
+        cache_key = (url, user_agent)
+        cached = _get_cached_response(cache_key)
+        if cached is not None:
+            headers.update(cached[0])
+
+        # Make the request, streaming the body so huge pages are never fully loaded
+        response = _http_session.get(
             url,
             headers=headers,
             timeout=timeout,
             allow_redirects=True,
+            stream=True,
         )
+        try:
+            if cached is not None and response.status_code == 304:
+                return _truncate_content(cached[1], max_content_length)
+
+            # Check for HTTP errors
+            response.raise_for_status()
+
+            text, cut_off = _read_capped_text(response, MAX_RESPONSE_BYTES)
+        finally:
+            response.close()
+
+        if cut_off:
+            # Apply content length truncation, noting that the download itself was cut short
+            content = _truncate_content(text, max_content_length)
+            return content + f"\n\n[Download stopped after {MAX_RESPONSE_BYTES:,} bytes]"
 
-        # Check for HTTP errors
-        response.raise_for_status()
+        _cache_response(cache_key, response, text)
 
         # Apply content length truncation
-        content = _truncate_content(response.text, max_content_length)
+        content = _truncate_content(text, max_content_length)
         return content
 
     except requests.exceptions.Timeout:
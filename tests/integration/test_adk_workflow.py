@@ -1,47 +1,43 @@
 """Integration tests for ADK workflow."""
 
+import inspect
+
 import pytest
 
 
+@pytest.fixture(scope="module")
+def workflow_agent(tmp_path_factory):
+    """Build the ADK workflow agent once and share it across the read-only tests below."""
+    from agentic_data_scientist.agents.adk import create_agent
+
+    return create_agent(working_dir=str(tmp_path_factory.mktemp("adk_workflow")))
+
+
 @pytest.mark.integration
 class TestADKWorkflow:
     """Test full ADK workflow integration."""
 
-    def test_create_agent(self):
+    def test_create_agent(self, workflow_agent):
         """Test creating an ADK agent with local tools."""
-        import tempfile
+        assert workflow_agent is not None
+        assert workflow_agent.name == "agentic_data_scientist_workflow"
 
-        from agentic_data_scientist.agents.adk import create_agent
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            agent = create_agent(working_dir=tmpdir)
-            assert agent is not None
-            assert agent.name == "agentic_data_scientist_workflow"
-
-    def test_agent_has_sub_agents(self):
+    def test_agent_has_sub_agents(self, workflow_agent):
         """Test that created agent has proper sub-agents."""
-        import tempfile
+        # SequentialAgent has sub_agents
+        assert hasattr(workflow_agent, 'sub_agents')
+        assert len(workflow_agent.sub_agents) == 4  # planning_loop, parser, orchestrator, summary
 
-        from agentic_data_scientist.agents.adk import create_agent
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            agent = create_agent(working_dir=tmpdir)
-            # SequentialAgent has sub_agents
-            assert hasattr(agent, 'sub_agents')
-            assert len(agent.sub_agents) == 4  # planning_loop, parser, orchestrator, summary
-
-    def test_agent_with_tools_integration(self):
+    def test_agent_with_tools_integration(self, workflow_agent):
         """Test agent creation with local tools integration."""
-        import tempfile
-
-        from agentic_data_scientist.agents.adk import create_agent
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            agent = create_agent(working_dir=tmpdir)
-
-            # Verify agent was created successfully
-            assert agent is not None
-            assert hasattr(agent, 'sub_agents')
+        # Verify agent was created successfully
+        assert workflow_agent is not None
+        assert hasattr(workflow_agent, 'sub_agents')
+
+        # Local tools must be async so blocking I/O runs off the event loop
+        summary_agent = workflow_agent.sub_agents[-1]
+        assert summary_agent.tools
+        assert all(inspect.iscoroutinefunction(tool) for tool in summary_agent.tools)
 
 
 @pytest.mark.integration
@@ -3,6 +3,8 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from agentic_data_scientist.agents.claude_code.agent import ClaudeCodeAgent, setup_working_directory
 
 
@@ -97,3 +99,80 @@ class TestSetupWorkingDirectory:
             # Should still have correct structure
             assert (working_dir / "user_data").exists()
             assert (working_dir / "pyproject.toml").exists()
+
+
+class TestExitLoopCallback:
+    """Test the review confirmation exit-loop callback."""
+
+    @staticmethod
+    def _context(decision):
+        from types import SimpleNamespace
+
+        from google.adk.events import EventActions
+
+        session = SimpleNamespace(state={"decision": decision})
+        return SimpleNamespace(
+            _invocation_context=SimpleNamespace(session=session),
+            _event_actions=EventActions(),
+        )
+
+    def test_exit_decision_escalates(self):
+        """An exit decision sets escalate and returns content to emit the event."""
+        from agentic_data_scientist.agents.adk.review_confirmation import _create_exit_loop_callback
+
+        ctx = self._context({"exit": True, "reason": "approved"})
+        result = _create_exit_loop_callback("decision")(ctx)
+
+        assert result is not None
+        assert ctx._event_actions.escalate is True
+
+    @pytest.mark.parametrize("decision", [None, {"exit": False, "reason": "fix bugs"}, "not-a-dict"])
+    def test_non_exit_decisions_continue(self, decision):
+        """Missing, negative or malformed decisions never escalate."""
+        from agentic_data_scientist.agents.adk.review_confirmation import _create_exit_loop_callback
+
+        ctx = self._context(decision)
+        result = _create_exit_loop_callback("decision")(ctx)
+
+        assert result is None
+        assert not ctx._event_actions.escalate
+
+
+class TestNonEscalatingLoopAgent:
+    """Test NonEscalatingLoopAgent escalation handling."""
+
+    @staticmethod
+    def _scripted_agent(name, events):
+        from google.adk.agents import BaseAgent
+
+        class _ScriptedAgent(BaseAgent):
+            async def run_async(self, parent_context):
+                for event in events:
+                    yield event
+
+        return _ScriptedAgent(name=name)
+
+    async def test_escalation_stops_loop_without_mutating_event(self):
+        """The escalating event is copied with escalate cleared; later agents never run."""
+        from google.adk.events import Event, EventActions
+
+        from agentic_data_scientist.agents.adk.agent import NonEscalatingLoopAgent
+
+        plain = Event(author="first")
+        escalating = Event(author="first", actions=EventActions(escalate=True))
+        loop = NonEscalatingLoopAgent(
+            name="loop",
+            sub_agents=[
+                self._scripted_agent("first", [plain, escalating]),
+                self._scripted_agent("second", [Event(author="second")]),
+            ],
+            max_iterations=3,
+        )
+
+        events = [event async for event in loop._run_async_impl(None)]
+
+        assert [event.author for event in events] == ["first", "first"]
+        assert events[0] is plain
+        assert events[1].id == escalating.id
+        assert events[1].actions.escalate is False
+        assert escalating.actions.escalate is True
@@ -0,0 +1,27 @@
+"""Unit tests for the CLI helpers."""
+
+import os
+
+from agentic_data_scientist.cli.main import _prepare_file_list
+
+
+class TestPrepareFileList:
+    """Test resolving --files arguments."""
+
+    def test_missing_path_is_skipped(self, tmp_path, capsys):
+        """A missing path is reported and skipped."""
+        data = tmp_path / "data.csv"
+        data.write_text("a,b\n")
+
+        files = _prepare_file_list((str(tmp_path / "missing.csv"), str(data)))
+
+        assert files == [("data.csv", str(data))]
+        assert "Warning: File not found" in capsys.readouterr().err
+
+    def test_symlink_loop_is_reported_as_missing(self, tmp_path, capsys):
+        """Symlinks pointing at each other are reported instead of crashing."""
+        os.symlink(tmp_path / "b", tmp_path / "a")
+        os.symlink(tmp_path / "a", tmp_path / "b")
+
+        assert _prepare_file_list((str(tmp_path / "a"),)) == []
+        assert "Warning: File not found" in capsys.readouterr().err
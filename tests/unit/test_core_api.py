@@ -1,5 +1,8 @@
 """Unit tests for core API."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -190,3 +193,288 @@ class TestResolveRunStatus:
             assert await ds._resolve_run_status(default="custom") == "custom"
         finally:
             ds.cleanup()
+
+
+@pytest.fixture
+def fake_ds(tmp_path, monkeypatch):
+    """
+    Return a factory that builds a DataScientist whose run_async is faked.
+
+    The factory takes an optional ``behavior(worker, message, context)`` coroutine
+    function. A Result it returns is passed through; any other value becomes the
+    response of a completed Result. Without a behavior each message is echoed.
+    """
+
+    def make(behavior=None):
+        async def fake_run_async(self, message, files=None, stream=False, context=None):
+            outcome = await behavior(self, message, context) if behavior else message
+            if isinstance(outcome, Result):
+                return outcome
+            return Result(session_id=self.session_id, status="completed", response=outcome)
+
+        monkeypatch.setattr(DataScientist, "run_async", fake_run_async)
+        return DataScientist(agent_type="adk", working_dir=str(tmp_path))
+
+    return make
+
+
+class TestRunBatch:
+    """Test concurrent batch execution."""
+
+    @pytest.mark.asyncio
+    async def test_results_preserve_order_and_isolate_sessions(self, tmp_path, fake_ds):
+        """Each message runs in its own session and results come back in input order."""
+
+        async def behavior(worker, message, context):
+            await asyncio.sleep(0.01 if message == "first" else 0)
+            return message
+
+        ds = fake_ds(behavior)
+
+        results = await ds.run_batch_async(["first", "second", "third"], max_concurrency=2)
+
+        assert [r.response for r in results] == ["first", "second", "third"]
+        assert len({r.session_id for r in results}) == 3
+        assert ds.session_id not in {r.session_id for r in results}
+        (batch_dir,) = tmp_path.glob("batch_*")
+        assert sorted(p.name for p in batch_dir.iterdir()) == ["item_000", "item_001", "item_002"]
+
+    @pytest.mark.asyncio
+    async def test_batches_use_separate_folders(self, tmp_path, fake_ds):
+        """Repeated batches on one instance must not reuse output folders or leak into files_created."""
+
+        async def behavior(worker, message, context):
+            (worker.working_dir / "out.txt").write_text(message)
+            return message
+
+        ds = fake_ds(behavior)
+        (tmp_path / "report.md").write_text("parent output")
+
+        await ds.run_batch_async(["one"])
+        await ds.run_batch_async(["two"])
+
+        outputs = sorted(p.read_text() for p in tmp_path.glob("batch_*/item_000/out.txt"))
+        assert outputs == ["one", "two"]
+        assert ds._list_created_files() == ["report.md"]
+
+    @pytest.mark.asyncio
+    async def test_passes_context_copy_to_each_item(self, fake_ds):
+        """Every item receives the batch context without sharing one dict."""
+        seen = []
+
+        async def behavior(worker, message, context):
+            seen.append(context)
+            return message
+
+        ds = fake_ds(behavior)
+        context = {"topic": "sales"}
+
+        await ds.run_batch_async(["a", "b"], context=context)
+
+        assert seen == [context, context]
+        assert seen[0] is not seen[1]
+        assert all(item_context is not context for item_context in seen)
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self, fake_ds):
+        """No more than max_concurrency runs should be in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def behavior(worker, message, context):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return message
+
+        ds = fake_ds(behavior)
+
+        await ds.run_batch_async([str(i) for i in range(6)], max_concurrency=2)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_items(self, fake_ds):
+        """Error results and exceptions are retried up to the configured count."""
+        calls = {}
+
+        async def behavior(worker, message, context):
+            calls[message] = calls.get(message, 0) + 1
+            if message == "raises":
+                raise RuntimeError("boom")
+            if calls[message] == 1:
+                return Result(session_id=worker.session_id, status="error", error="transient")
+            return message
+
+        ds = fake_ds(behavior)
+
+        results = await ds.run_batch_async(["flaky", "raises"], retries=1)
+
+        assert results[0].status == "completed"
+        assert results[1].status == "error"
+        assert results[1].error == "boom"
+        assert calls == {"flaky": 2, "raises": 2}
+
+    @pytest.mark.asyncio
+    async def test_retry_uses_fresh_worker(self, fake_ds):
+        """A retried item runs in a new session instead of the failed one."""
+        sessions = []
+
+        async def behavior(worker, message, context):
+            sessions.append(worker.session_id)
+            status = "error" if len(sessions) == 1 else "completed"
+            return Result(session_id=worker.session_id, status=status)
+
+        ds = fake_ds(behavior)
+
+        (result,) = await ds.run_batch_async(["flaky"], retries=1)
+
+        assert result.status == "completed"
+        assert len(set(sessions)) == 2
+        assert result.session_id == sessions[1]
+
+    @pytest.mark.asyncio
+    async def test_worker_construction_error_is_item_result(self, fake_ds, monkeypatch):
+        """A worker that cannot be created fails only its own item."""
+        ds = fake_ds()
+        spawn = ds._spawn_batch_worker
+
+        def flaky_spawn(batch_dir, index):
+            if index == 0:
+                raise OSError("disk full")
+            return spawn(batch_dir, index)
+
+        monkeypatch.setattr(ds, "_spawn_batch_worker", flaky_spawn)
+
+        results = await ds.run_batch_async(["bad", "good"])
+
+        assert results[0].status == "error"
+        assert results[0].error == "disk full"
+        assert results[1].response == "good"
+
+    @pytest.mark.asyncio
+    async def test_as_completed_yields_in_completion_order(self, fake_ds):
+        """A slow item must not hold back results (or free slots) for faster ones."""
+        delays = {"slow": 0.05, "fast1": 0, "fast2": 0, "fast3": 0}
+
+        async def behavior(worker, message, context):
+            await asyncio.sleep(delays[message])
+            return message
+
+        ds = fake_ds(behavior)
+
+        order = [
+            (index, result.response)
+            async for index, result in ds.run_batch_as_completed(list(delays), max_concurrency=2)
+        ]
+
+        assert order[-1] == (0, "slow")
+        assert sorted(order) == [(0, "slow"), (1, "fast1"), (2, "fast2"), (3, "fast3")]
+
+    @pytest.mark.asyncio
+    async def test_as_completed_reports_escaped_errors_per_item(self, fake_ds, monkeypatch):
+        """An exception escaping an item must not end the iteration for the others."""
+        ds = fake_ds()
+
+        async def fake_run_batch_item(batch_dir, index, message, files, context, retries):
+            if message == "bad":
+                raise RuntimeError("escaped")
+            return index, Result(session_id="worker", status="completed", response=message)
+
+        monkeypatch.setattr(ds, "_run_batch_item", fake_run_batch_item)
+
+        results = dict([item async for item in ds.run_batch_as_completed(["bad", "good"])])
+
+        assert results[0].status == "error"
+        assert results[0].error == "escaped"
+        assert results[1].response == "good"
+
+    @pytest.mark.asyncio
+    async def test_as_completed_early_exit_awaits_cancelled_runs(self, fake_ds):
+        """Closing the iterator early cancels and awaits the runs still in flight."""
+        cancelled = []
+
+        async def behavior(worker, message, context):
+            try:
+                await asyncio.sleep(0 if message == "fast" else 10)
+            except asyncio.CancelledError:
+                cancelled.append(message)
+                raise
+            return message
+
+        ds = fake_ds(behavior)
+
+        batch = ds.run_batch_as_completed(["fast", "slow1", "slow2"], max_concurrency=3)
+        index, result = await anext(batch)
+        await batch.aclose()
+
+        assert (index, result.response) == (0, "fast")
+        assert sorted(cancelled) == ["slow1", "slow2"]
+
+    def test_sync_wrapper(self, fake_ds):
+        """run_batch should return the same results as run_batch_async."""
+
+        async def behavior(worker, message, context):
+            return message.upper()
+
+        ds = fake_ds(behavior)
+
+        results = ds.run_batch(["a", "b"])
+
+        assert [r.response for r in results] == ["A", "B"]
+
+
+class TestSyncWrappers:
+    """Test the synchronous wrappers around the async API."""
+
+    @pytest.mark.asyncio
+    async def test_run_inside_running_loop(self, fake_ds):
+        """run() must work when called from code already running an event loop."""
+
+        async def behavior(worker, message, context):
+            await asyncio.sleep(0)
+            return message
+
+        ds = fake_ds(behavior)
+
+        result = ds.run("hello")
+
+        assert result.status == "completed"
+        assert result.response == "hello"
+
+    def test_run_offloads_to_bounded_executor(self, fake_ds):
+        """Blocking work offloaded during run() should use the instance's named thread pool."""
+
+        async def behavior(worker, message, context):
+            return await asyncio.to_thread(lambda: threading.current_thread().name)
+
+        ds = fake_ds(behavior)
+
+        assert ds.run("hello").response.startswith("agentic-ds")
+        # The pool is owned by the loop of each sync call, so repeated calls keep working
+        assert ds.run("again").response.startswith("agentic-ds")
+
+    @pytest.mark.asyncio
+    async def test_bounded_executor_installed_once_per_loop(self, tmp_path, monkeypatch):
+        """Several instances on one loop must share a single installed pool."""
+        loop = asyncio.get_running_loop()
+        installed = []
+        monkeypatch.setattr(loop, "set_default_executor", installed.append)
+
+        async with DataScientist(agent_type="adk", working_dir=str(tmp_path / "a")):
+            async with DataScientist(agent_type="adk", working_dir=str(tmp_path / "b")):
+                pass
+
+        assert len(installed) == 1
+
+    def test_bounded_executor_keeps_existing_default_executor(self, tmp_path):
+        """An executor the application already installed must not be replaced."""
+
+        async def thread_name_in_default_executor():
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(thread_name_prefix="app-pool"))
+            async with DataScientist(agent_type="adk", working_dir=str(tmp_path)):
+                return await asyncio.to_thread(lambda: threading.current_thread().name)
+
+        assert asyncio.run(thread_name_in_default_executor()).startswith("app-pool")
@@ -0,0 +1,89 @@
+"""Unit tests for LoopDetectionAgent pattern detection."""
+
+import random
+
+import pytest
+
+from agentic_data_scientist.agents.adk.loop_detection import LoopDetectionAgent
+
+
+def _brute_force_run(text, period, repetitions):
+    """Reference implementation: try every start offset."""
+    for start in range(len(text) - period * repetitions + 1):
+        pattern = text[start : start + period]
+        if all(text[start + k * period : start + (k + 1) * period] == pattern for k in range(repetitions)):
+            return True
+    return False
+
+
+@pytest.fixture
+def agent():
+    return LoopDetectionAgent(
+        name="loop_test_agent",
+        model="gemini-2.0-flash",
+        min_pattern_length=20,
+        max_pattern_length=100,
+        repetition_threshold=5,
+    )
+
+
+class TestFindPeriodicRun:
+    """Test the linear-time periodic run finder against a brute-force reference."""
+
+    @pytest.mark.parametrize("repetitions", [2, 3, 5])
+    def test_matches_brute_force(self, repetitions):
+        """Random low-entropy strings exercise partial runs and chunk boundaries."""
+        rng = random.Random(1234 + repetitions)
+        for _ in range(300):
+            unit = "".join(rng.choice("ab") for _ in range(rng.randint(1, 6)))
+            copies = rng.randint(0, 6)
+            prefix, suffix = ("".join(rng.choice("abc") for _ in range(rng.randint(0, 12))) for _ in range(2))
+            text = prefix + unit * copies + suffix
+            for period in range(1, 9):
+                found = LoopDetectionAgent._find_periodic_run(text, period, repetitions)
+                assert (found is not None) == _brute_force_run(text, period, repetitions), (text, period)
+                if found is not None:
+                    pattern = text[found : found + period]
+                    assert text[found : found + period * repetitions] == pattern * repetitions
+
+    def test_too_short(self):
+        """Text shorter than the required span cannot contain a run."""
+        assert LoopDetectionAgent._find_periodic_run("abcabc", 3, 3) is None
+
+
+class TestDetectPatternRepetition:
+    """Test loop detection on realistic text."""
+
+    def test_detects_repeated_block(self, agent):
+        """A block repeated past the threshold is reported."""
+        block = "The analysis step failed, retrying with the same parameters now. "
+        text = "Some preamble text before the loop starts. " + block * 6
+
+        detected, pattern = agent._detect_pattern_repetition(text)
+
+        assert detected
+        assert pattern and pattern in text
+
+    def test_ignores_too_few_repetitions(self, agent):
+        """Repetitions below the threshold are not a loop."""
+        block = "The analysis step failed, retrying with the same parameters now. "
+        text = "Some preamble text before the loop starts. " + block * 4 + "Then it moved on."
+
+        assert agent._detect_pattern_repetition(text) == (False, None)
+
+    def test_whitespace_differences_are_normalized(self, agent):
+        """Repetitions that differ only in whitespace still count."""
+        block = "Reading file data.csv to check\tthe column names again. "
+        text = "".join(block.replace(" ", " " * (i % 3 + 1)) for i in range(6))
+
+        detected, _ = agent._detect_pattern_repetition(text)
+
+        assert detected
+
+    def test_non_repetitive_text(self, agent):
+        """Ordinary prose does not trigger detection."""
+        rng = random.Random(7)
+        words = ["data", "model", "result", "figure", "stage", "value", "column", "sample"]
+        text = " ".join(rng.choice(words) for _ in range(800))
+
+        assert agent._detect_pattern_repetition(text) == (False, None)
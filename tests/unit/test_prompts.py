@@ -0,0 +1,35 @@
+"""Unit tests for prompt loading."""
+
+from pathlib import Path
+
+import pytest
+
+import agentic_data_scientist.prompts as prompts
+from agentic_data_scientist.prompts import load_prompt, load_prompt_parts
+
+
+BASE_PROMPTS = sorted(path.stem for path in (Path(prompts.__file__).parent / "base").glob("*.md"))
+
+
+class TestLoadPromptParts:
+    """Test splitting prompts into a static part and a context block."""
+
+    @pytest.mark.parametrize("name", BASE_PROMPTS)
+    def test_static_part_has_no_state_placeholders(self, name):
+        """Test that every state placeholder lands in the context block."""
+        static, context = load_prompt_parts(name)
+        assert "?}" not in static
+        assert load_prompt(name).count("?}") == context.count("?}")
+
+    def test_split_at_context_heading(self):
+        """Test that the split is made at the heading introducing the placeholders."""
+        static, context = load_prompt_parts("plan_review_confirmation")
+        assert context.startswith("# Context\n")
+        assert "{high_level_plan?}" in context
+        assert "# Decision Criteria" in static
+
+    def test_prompt_without_placeholders(self):
+        """Test that a prompt without placeholders is entirely static."""
+        static, context = load_prompt_parts("coding_base")
+        assert static == load_prompt("coding_base")
+        assert context == ""
@@ -200,3 +200,92 @@ class TestOrchestratorStatusFlow:
 
         assert session.state["run_status"] == "incomplete"
         assert "Crit A" in session.state["unmet_criteria_summary"]
+
+    async def test_runs_stages_in_order_including_appended(self):
+        # The reflector appends a stage after the first one completes; it must run last.
+        executed = []
+
+        def _impl_record(ctx):
+            executed.append(ctx.session.state["current_stage"]["title"])
+            _impl_approved(ctx)
+
+        def _append_stage_once(ctx):
+            stages = ctx.session.state["high_level_stages"]
+            if len(stages) == 2:
+                stages.append({"index": 2, "title": "Stage C", "description": "do C"})
+
+        def _met_after_three(ctx):
+            if len(executed) == 3:
+                _mark_all_criteria_met(ctx)
+
+        orch = _make_orchestrator(
+            impl_on_run=_impl_record, crit_on_run=_met_after_three, refl_on_run=_append_stage_once
+        )
+        ctx, session = await _make_ctx(
+            orch,
+            stages=[
+                {"index": 0, "title": "Stage A", "description": "do A"},
+                {"index": 1, "title": "Stage B", "description": "do B"},
+            ],
+            criteria=[{"index": 0, "criteria": "Crit A", "met": False}],
+        )
+
+        await _run(orch, ctx)
+
+        assert executed == ["Stage A", "Stage B", "Stage C"]
+        assert session.state["run_status"] == "completed"
+
+    async def test_stops_when_extended_plan_makes_no_progress(self):
+        # The reflector extends the plan once with several stages, but criteria never move.
+        executed = []
+
+        def _impl_record(ctx):
+            executed.append(ctx.session.state["current_stage"]["title"])
+            _impl_approved(ctx)
+
+        def _extend_when_exhausted(ctx):
+            stages = ctx.session.state["high_level_stages"]
+            if all(s.get("completed", False) for s in stages):
+                for idx in range(len(stages), len(stages) + 5):
+                    stages.append({"index": idx, "title": f"Extra {idx}", "description": "more"})
+
+        orch = _make_orchestrator(impl_on_run=_impl_record, refl_on_run=_extend_when_exhausted)
+        ctx, session = await _make_ctx(
+            orch,
+            stages=[{"index": 0, "title": "Stage A", "description": "do A"}],
+            criteria=[{"index": 0, "criteria": "Crit A", "met": False}],
+        )
+
+        events = await _run(orch, ctx)
+
+        # Far fewer stages run than the 50-iteration safety cap would allow
+        assert executed == ["Stage A", "Extra 1", "Extra 2", "Extra 3"]
+        assert session.state["run_status"] == "incomplete"
+        assert "No success criteria progress" in events[-1].content.parts[0].text
+
+    async def test_stops_after_unproductive_plan_extensions(self):
+        # Each extension adds one stage that never advances the criteria.
+        executed = []
+
+        def _impl_record(ctx):
+            executed.append(ctx.session.state["current_stage"]["title"])
+            _impl_approved(ctx)
+
+        def _extend_when_exhausted(ctx):
+            stages = ctx.session.state["high_level_stages"]
+            if all(s.get("completed", False) for s in stages):
+                idx = len(stages)
+                stages.append({"index": idx, "title": f"Extra {idx}", "description": "more"})
+
+        orch = _make_orchestrator(impl_on_run=_impl_record, refl_on_run=_extend_when_exhausted)
+        ctx, session = await _make_ctx(
+            orch,
+            stages=[{"index": 0, "title": "Stage A", "description": "do A"}],
+            criteria=[{"index": 0, "criteria": "Crit A", "met": False}],
+        )
+
+        events = await _run(orch, ctx)
+
+        assert executed == ["Stage A", "Extra 1", "Extra 2"]
+        assert session.state["run_status"] == "incomplete"
+        assert "plan extensions did not advance" in events[-1].content.parts[0].text
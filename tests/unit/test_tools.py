@@ -7,9 +7,12 @@ security boundary validation and edge cases.
 
 import base64
 import json
+from http.client import HTTPMessage
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
+from requests.cookies import extract_cookies_to_jar
 
 from agentic_data_scientist.tools import (
     directory_tree,
@@ -19,6 +22,7 @@ from agentic_data_scientist.tools import (
     read_file,
     read_media_file,
     search_files,
+    web_ops,
 )
 
 
@@ -319,11 +323,19 @@ class TestGetFileInfo:
 class TestFetchUrl:
     """Tests for fetch_url function."""
 
-    @patch("agentic_data_scientist.tools.web_ops.requests.get")
+    @pytest.fixture(autouse=True)
+    def clear_response_cache(self):
+        """Keep cached responses from leaking between tests."""
+        web_ops._response_cache.clear()
+        yield
+        web_ops._response_cache.clear()
+
+    @patch("agentic_data_scientist.tools.web_ops._http_session.get")
     def test_fetch_url_success(self, mock_get):
         """Test successful URL fetch."""
         mock_response = Mock()
-        mock_response.text = "Success content"
+        mock_response.iter_content.return_value = [b"Success ", b"content"]
+        mock_response.encoding = "utf-8"
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -332,11 +344,12 @@ class TestFetchUrl:
         assert result == "Success content"
         mock_get.assert_called_once()
 
-    @patch("agentic_data_scientist.tools.web_ops.requests.get")
+    @patch("agentic_data_scientist.tools.web_ops._http_session.get")
     def test_fetch_url_with_user_agent(self, mock_get):
         """Test fetch with custom user agent."""
         mock_response = Mock()
-        mock_response.text = "Content"
+        mock_response.iter_content.return_value = [b"Content"]
+        mock_response.encoding = "utf-8"
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -346,7 +359,7 @@ class TestFetchUrl:
         call_kwargs = mock_get.call_args[1]
         assert call_kwargs["headers"]["User-Agent"] == "TestBot/1.0"
 
-    @patch("agentic_data_scientist.tools.web_ops.requests.get")
+    @patch("agentic_data_scientist.tools.web_ops._http_session.get")
     def test_fetch_url_timeout(self, mock_get):
         """Test fetch with timeout."""
         import requests
@@ -358,7 +371,7 @@ class TestFetchUrl:
         assert "Error" in result
         assert "timed out" in result
 
-    @patch("agentic_data_scientist.tools.web_ops.requests.get")
+    @patch("agentic_data_scientist.tools.web_ops._http_session.get")
     def test_fetch_url_connection_error(self, mock_get):
         """Test fetch with connection error."""
         import requests
@@ -370,7 +383,7 @@ class TestFetchUrl:
         assert "Error" in result
         assert "connect" in result.lower()
 
-    @patch("agentic_data_scientist.tools.web_ops.requests.get")
+    @patch("agentic_data_scientist.tools.web_ops._http_session.get")
     def test_fetch_url_http_error(self, mock_get):
         """Test fetch with HTTP error."""
         import requests
@@ -389,6 +402,63 @@ class TestFetchUrl:
         assert "Error" in result
         assert "404" in result
 
+    @patch("agentic_data_scientist.tools.web_ops._http_session.get")
+    def test_fetch_url_revalidates_cached_response(self, mock_get):
+        """Test that a 304 response reuses the previously fetched content."""
+        first_response = Mock(status_code=200, encoding="utf-8", headers={"ETag": '"v1"'})
+        first_response.iter_content.return_value = [b"Cached content"]
+        not_modified = Mock(status_code=304, headers={})
+        mock_get.side_effect = [first_response, not_modified]
+
+        assert fetch_url("https://example.com/doc") == "Cached content"
+        assert fetch_url("https://example.com/doc") == "Cached content"
+
+        assert "If-None-Match" not in mock_get.call_args_list[0][1]["headers"]
+        assert mock_get.call_args_list[1][1]["headers"]["If-None-Match"] == '"v1"'
+
+    @patch("agentic_data_scientist.tools.web_ops.MAX_RESPONSE_BYTES", 10)
+    @patch("agentic_data_scientist.tools.web_ops._http_session.get")
+    def test_fetch_url_stops_download_at_byte_limit(self, mock_get):
+        """Test that oversized bodies are only read up to the byte limit."""
+        mock_response = Mock(encoding="utf-8")
+        mock_response.iter_content.return_value = iter([b"0123456", b"789abc", b"never read"])
+        mock_get.return_value = mock_response
+
+        result = fetch_url("https://example.com/huge")
+
+        assert result.startswith("0123456789\n")
+        assert "Download stopped after 10 bytes" in result
+        assert next(mock_response.iter_content.return_value) == b"never read"
+        mock_response.close.assert_called_once()
+
+    @patch("agentic_data_scientist.tools.web_ops.RESPONSE_CACHE_MAX_CHARS", 10)
+    @patch("agentic_data_scientist.tools.web_ops._http_session.get")
+    def test_fetch_url_cache_bounded_by_total_size(self, mock_get):
+        """Test that the revalidation cache evicts old entries to stay under its size limit."""
+        responses = []
+        for body in (b"aaaaaa", b"bbbbbb", b"way too large"):
+            response = Mock(status_code=200, encoding="utf-8", headers={"ETag": '"v1"'})
+            response.iter_content.return_value = [body]
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        for path in ("a", "b", "large"):
+            fetch_url(f"https://example.com/{path}")
+
+        assert list(web_ops._response_cache) == [("https://example.com/b", None)]
+
+    def test_shared_session_keeps_no_cookies(self):
+        """Test that Set-Cookie responses are not stored on the shared session."""
+        request = requests.Request("GET", "https://example.com/").prepare()
+        headers = HTTPMessage()
+        headers["Set-Cookie"] = "tracking=1; Path=/"
+        raw_response = Mock()
+        raw_response._original_response.msg = headers
+
+        extract_cookies_to_jar(web_ops._http_session.cookies, request, raw_response)
+
+        assert len(web_ops._http_session.cookies) == 0
+
     def test_fetch_url_invalid_scheme(self):
         """Test fetch with invalid URL scheme."""
         result = fetch_url("ftp://example.com")